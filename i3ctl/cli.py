@@ -7,19 +7,52 @@ import argparse
 import logging
 import sys
 import os
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from i3ctl import __version__
 from i3ctl.utils.logger import setup_logger, logger
 from i3ctl.utils.config import load_config, get_config_value
 from i3ctl.utils.system import detect_tools
-from i3ctl.commands import get_command_classes, _commands
+from i3ctl.commands import COMMAND_MODULES, get_command_classes
 
 
-def setup_parser() -> argparse.ArgumentParser:
+# Global options that consume the following argument
+OPTIONS_WITH_VALUES = {"--log-file"}
+
+
+def get_requested_command(argv: List[str], commands: Dict[str, Any]) -> Optional[str]:
+    """
+    Get the command named on the command line, if it can be determined.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        commands: Known command names
+
+    Returns:
+        Requested command name or None if it cannot be determined
+    """
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif arg in OPTIONS_WITH_VALUES:
+            skip_next = True
+        elif not arg.startswith("-"):
+            return arg if arg in commands else None
+    
+    return None
+
+
+def setup_parser(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
     """
     Set up command line argument parser.
 
+    Only the parser of the requested command is built when it can be
+    determined from argv; otherwise all command parsers are built.
+
+    Args:
+        argv: Command line arguments used to select the command to build
+
     Returns:
         Configured argument parser
     """
@@ -54,11 +87,12 @@ def setup_parser() -> argparse.ArgumentParser:
     # Add subparsers for commands
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
-    # Register all commands
-    commands = get_command_classes()
-    for name, command_class in commands.items():
+    # Register the requested command, or all commands for help/usage.
+    # Only the requested command's module is imported when it is known.
+    requested = get_requested_command(argv or [], COMMAND_MODULES)
+    for command_class in get_command_classes(requested).values():
         command_instance = command_class()
-        command_instance.setup_parser(subparsers)
+        command_instance.setup_parser(subparsers, argv)
     
     return parser
 
@@ -109,16 +143,21 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Load configuration
         config = load_config()
         
+        # Only the console script entry point, which passes no arguments, lets
+        # a command replace this process with another program
+        allow_exec = argv is None
+        
         # Parse arguments
-        parser = setup_parser()
-        args = parser.parse_args(argv or sys.argv[1:])
+        argv = argv or sys.argv[1:]
+        parser = setup_parser(argv)
+        args = parser.parse_args(argv)
         
         # Configure logging
         configure_logging(args)
         
-        # Detect available tools
-        tools = detect_tools()
-        logger.debug(f"Detected tools: {tools}")
+        # Detect available tools; only logged, so skip the PATH probes otherwise
+        if logger.logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Detected tools: {detect_tools()}")
         
         # If no command is specified, show help
         if not args.command:
@@ -128,6 +167,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         # Execute command if function is provided
         if hasattr(args, "func"):
             try:
+                args.allow_exec = allow_exec
+                
                 # Capture return value from command handler
                 return_code = args.func(args)
                 # Return the command's exit code or 0 if None
@@ -176,7 +217,7 @@ def execute_command(args: List[str]) -> int:
         command_args = args[1:]
         
         # Get the command class
-        commands = get_command_classes()
+        commands = get_command_classes(command_name)
         if command_name not in commands:
             logger.error(f"Unknown command: {command_name}")
             return 1
@@ -184,7 +225,7 @@ def execute_command(args: List[str]) -> int:
         # Create parser for this command
         parser = argparse.ArgumentParser(description=f"Execute {command_name} command")
         command_instance = commands[command_name]()
-        command_instance.setup_parser(parser.add_subparsers())
+        command_instance.setup_parser(parser.add_subparsers(), [command_name] + command_args)
         
         # Parse arguments
         parsed_args = parser.parse_args([command_name] + command_args)
@@ -2,11 +2,30 @@
 Command modules for i3ctl.
 """
 
+import importlib
+from typing import Optional
+
 from i3ctl.commands.base import BaseCommand
 
 # Command registry for automatic registration
 _commands = {}
 
+# Command name -> module defining it, so one command can be imported on its own
+COMMAND_MODULES = {
+    "config": "i3ctl.commands.config",
+    "brightness": "i3ctl.commands.brightness",
+    "volume": "i3ctl.commands.volume",
+    "wallpaper": "i3ctl.commands.wallpaper",
+    "layout": "i3ctl.commands.layout",
+    "startup": "i3ctl.commands.startup",
+    "power": "i3ctl.commands.power",
+    "network": "i3ctl.commands.network",
+    "bluetooth": "i3ctl.commands.bluetooth",
+    "bar": "i3ctl.commands.bar",
+    "workspace": "i3ctl.commands.workspace",
+    "keybind": "i3ctl.commands.keybind",
+}
+
 def register_command(command_class):
     """
     Register a command class with the command registry.
@@ -21,31 +40,29 @@ def register_command(command_class):
     _commands[command_class.name] = command_class
     return command_class
 
-def get_command_classes():
+def get_command_classes(name: Optional[str] = None):
     """
-    Get all registered command classes.
+    Get registered command classes.
+    
+    Args:
+        name: Only import and return this command (all commands if None or unknown)
     
     Returns:
         Dictionary of command name to command class
     """
+    if name in COMMAND_MODULES:
+        importlib.import_module(COMMAND_MODULES[name])
+        return {name: _commands[name]}
+    
     # Ensure all commands are imported
-    from i3ctl.commands.config import ConfigCommand  
-    from i3ctl.commands.brightness import BrightnessCommand
-    from i3ctl.commands.volume import VolumeCommand
-    from i3ctl.commands.wallpaper import WallpaperCommand
-    from i3ctl.commands.layout import LayoutCommand
-    from i3ctl.commands.startup import StartupCommand
-    from i3ctl.commands.power import PowerCommand
-    from i3ctl.commands.network import NetworkCommand
-    from i3ctl.commands.bluetooth import BluetoothCommand
-    from i3ctl.commands.bar import BarCommand
-    from i3ctl.commands.workspace import WorkspaceCommand
-    from i3ctl.commands.keybind import KeybindCommand
+    for module in COMMAND_MODULES.values():
+        importlib.import_module(module)
     
     return _commands
 
 __all__ = [
     "BaseCommand",
+    "COMMAND_MODULES",
     "register_command",
     "get_command_classes"
 ]
\ No newline at end of file
@@ -22,18 +22,45 @@ class BaseCommand(ABC):
         Initialize command.
         """
         self.parser = None
+        self._argv: Optional[List[str]] = None
 
-    def setup_parser(self, subparsers) -> None:
+    def setup_parser(self, subparsers, argv: Optional[List[str]] = None) -> None:
         """
         Set up command parser.
 
         Args:
             subparsers: Subparsers object to add command to
+            argv: Arguments that will be parsed, used to build only the
+                requested subcommand (all subcommands are built if None)
         """
+        self._argv = argv
         self.parser = subparsers.add_parser(self.name, help=self.help)
         self.parser.set_defaults(func=self.handle)
         self._setup_arguments(self.parser)
 
+    def _requested_subcommand(self, choices) -> Optional[str]:
+        """
+        Get the subcommand requested in the arguments being parsed, if it is known.
+
+        Only succeeds when setup_parser() was given the arguments, this command
+        is their first positional argument and it is directly followed by one
+        of the given subcommands, so callers can skip building parsers for
+        subcommands that will not run.
+
+        Args:
+            choices: Names of the subcommands this command supports
+            
+        Returns:
+            Requested subcommand name or None if it cannot be determined
+        """
+        if self._argv is None:
+            return None
+        
+        positionals = [arg for arg in self._argv if not arg.startswith("-")]
+        if len(positionals) >= 2 and positionals[0] == self.name and positionals[1] in choices:
+            return positionals[1]
+        return None
+
     @abstractmethod
     def _setup_arguments(self, parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         """
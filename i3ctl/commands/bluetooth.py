@@ -6,7 +6,8 @@ import argparse
 import os
 import re
 import time
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from i3ctl.commands.base import BaseCommand
 from i3ctl.commands import register_command
@@ -14,6 +15,43 @@ from i3ctl.utils.logger import logger
 from i3ctl.utils.system import run_command, check_command_exists
 
 
+# BlueZ D-Bus service that owns the adapters and known devices
+BLUEZ_BUS_NAME = "org.bluez"
+
+
+def _get_bluez_devices() -> Optional[List[Dict[str, Any]]]:
+    """
+    Get known bluetooth devices from BlueZ over D-Bus, without spawning bluetoothctl.
+
+    Returns:
+        List of device dicts (address, name, paired, connected), or None if
+        D-Bus or BlueZ is unavailable
+    """
+    try:
+        from pydbus import SystemBus
+        objects = SystemBus().get(BLUEZ_BUS_NAME, "/").GetManagedObjects()
+    except Exception as e:
+        logger.debug(f"BlueZ is not available over D-Bus: {e}")
+        return None
+    
+    # One ObjectManager call returns every device with its name and state
+    devices = []
+    for interfaces in objects.values():
+        properties = interfaces.get("org.bluez.Device1")
+        if properties is None:
+            continue
+        
+        address = properties.get("Address", "")
+        devices.append({
+            "address": address,
+            "name": properties.get("Alias", properties.get("Name", address)),
+            "paired": properties.get("Paired", False),
+            "connected": properties.get("Connected", False),
+        })
+    
+    return devices
+
+
 @register_command
 class BluetoothCommand(BaseCommand):
     """
@@ -192,12 +230,21 @@ class BluetoothCommand(BaseCommand):
                 print("Warning: Cannot list devices through blueman CLI. Please use GUI instead.")
                 return
         
-        return_code, stdout, stderr = run_command(cmd)
-        
-        if return_code != 0:
-            logger.error(f"Failed to list devices: {stderr}")
-            print(f"Error: Failed to list devices: {stderr}")
-            return
+        # Read devices straight from BlueZ when it is reachable over D-Bus
+        devices = _get_bluez_devices()
+        if devices is not None:
+            stdout = "\n".join(
+                f"Device {device['address']} {device['name']}"
+                for device in devices
+                if device["paired"] or not paired_only
+            )
+        else:
+            return_code, stdout, stderr = run_command(cmd)
+            
+            if return_code != 0:
+                logger.error(f"Failed to list devices: {stderr}")
+                print(f"Error: Failed to list devices: {stderr}")
+                return
         
         if not stdout.strip():
             print("No devices found.")
@@ -370,7 +417,15 @@ class BluetoothCommand(BaseCommand):
                     print("Warning: Cannot show status. No suitable tools found.")
                     return
         
-        return_code, stdout, stderr = run_command(cmd)
+        # Query the adapter and its paired devices concurrently, since each
+        # bluetoothctl call spends most of its time waiting on bluetoothd
+        paired = None
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            status = pool.submit(run_command, cmd)
+            if tool == "bluetoothctl":
+                paired = pool.submit(run_command, ["bluetoothctl", "paired-devices"])
+        
+        return_code, stdout, stderr = status.result()
         
         if return_code != 0:
             logger.error(f"Failed to get bluetooth status: {stderr}")
@@ -385,9 +440,8 @@ class BluetoothCommand(BaseCommand):
         print(stdout)
         
         # Also show connected devices
-        if tool == "bluetoothctl":
-            connected_cmd = ["bluetoothctl", "paired-devices"]
-            code, out, err = run_command(connected_cmd)
+        if paired:
+            code, out, err = paired.result()
             if code == 0 and out.strip():
                 print("\nPaired Devices:")
                 print(out)
@@ -492,6 +546,12 @@ class BluetoothCommand(BaseCommand):
         if re.match(r"([0-9A-F]{2}[:-]){5}([0-9A-F]{2})", device_name, re.IGNORECASE):
             return device_name
             
+        # Look the device up over D-Bus, falling back to bluetoothctl when
+        # BlueZ is unreachable or does not list it
+        for device in _get_bluez_devices() or []:
+            if device_name.lower() in f"{device['address']} {device['name']}".lower():
+                return device["address"]
+        
         if tool == "bluetoothctl" or (tool == "blueman" and check_command_exists("bluetoothctl")):
             # Get all devices
             code, out, _ = run_command(["bluetoothctl", "devices"])
@@ -506,4 +566,4 @@ class BluetoothCommand(BaseCommand):
                     if len(parts) >= 2:
                         return parts[1]  # MAC address is the second item
         
-        return None
\ No newline at end of file
+        return None
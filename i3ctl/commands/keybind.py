@@ -488,10 +488,7 @@ class KeybindCommand(BaseCommand):
             
             # Update keybinding profile registry in config
             config = load_config()
-            if "keybinding_profiles" not in config:
-                config["keybinding_profiles"] = {}
-            
-            config["keybinding_profiles"][name] = {
+            config.setdefault("keybinding_profiles", {})[name] = {
                 "path": profile_path,
                 "count": len(bindings)
             }
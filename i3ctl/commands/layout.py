@@ -276,10 +276,7 @@ class LayoutCommand(BaseCommand):
         # Save the preset
         config = load_config()
         
-        if "layout_presets" not in config:
-            config["layout_presets"] = {}
-        
-        config["layout_presets"][name] = {
+        config.setdefault("layout_presets", {})[name] = {
             "layout": layout,
             "variant": variant,
             "options": options
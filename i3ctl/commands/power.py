@@ -3,15 +3,234 @@ Power management commands.
 """
 
 import argparse
+import datetime
+import glob
 import os
+import subprocess
 import sys
+import termios
 import time
+import tty
 from typing import Dict, List, Optional
 
 from i3ctl.commands.base import BaseCommand
 from i3ctl.commands import register_command
 from i3ctl.utils.logger import logger
-from i3ctl.utils.system import run_command, check_command_exists
+from i3ctl.utils.system import run_command, has_command
+
+
+def _first_on_path(commands: List[str]) -> Optional[str]:
+    """
+    Find the most preferred of several commands in a single walk of $PATH.
+
+    Args:
+        commands: Command names in order of preference
+
+    Returns:
+        Name of the most preferred command found or None if none are found
+    """
+    best = len(commands)
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        # Only look for commands preferred over the best one found so far
+        for rank in range(best):
+            path = os.path.join(directory, commands[rank])
+            if os.access(path, os.X_OK) and os.path.isfile(path):
+                best = rank
+                break
+        
+        if best == 0:
+            break
+    
+    return commands[best] if best < len(commands) else None
+
+
+# Screen lock commands in order of preference
+LOCK_COMMANDS = [
+    ["i3lock"],
+    ["xscreensaver-command", "-lock"],
+    ["gnome-screensaver-command", "--lock"],
+    ["loginctl", "lock-session"],
+    ["xdg-screensaver", "lock"],
+]
+
+# Power action -> (verb, progress message, logind method, systemctl verb, fallback command)
+POWER_ACTIONS = {
+    "off": ("Power off", "Powering off", "PowerOff", "poweroff", ["sudo", "shutdown", "-h", "now"]),
+    "reboot": ("Reboot", "Rebooting", "Reboot", "reboot", ["sudo", "shutdown", "-r", "now"]),
+    "suspend": ("Suspend", "Suspending", "Suspend", "suspend", ["sudo", "pm-suspend"]),
+    "hibernate": ("Hibernate", "Hibernating", "Hibernate", "hibernate", ["sudo", "pm-hibernate"]),
+    "hybrid-sleep": (
+        "Hybrid sleep", "Hybrid sleeping", "HybridSleep", "hybrid-sleep", ["sudo", "pm-suspend-hybrid"]
+    ),
+}
+
+# Power profile mode -> power-profiles-daemon profile
+MODE_TO_PPD = {
+    "performance": "performance",
+    "balanced": "balanced",
+    "power-saver": "power-saver",
+    "auto": "balanced",  # Default to balanced for auto
+}
+
+# Power profile mode -> CPU governor
+MODE_TO_GOVERNOR = {
+    "performance": "performance",
+    "balanced": "ondemand",
+    "power-saver": "powersave",
+    "auto": "ondemand",  # Default to ondemand for auto
+}
+
+# CPU governor -> profile name shown to the user
+GOVERNOR_TO_PROFILE = {
+    "performance": "Performance",
+    "powersave": "Power Saver",
+    "ondemand": "Balanced (Dynamic)",
+    "conservative": "Balanced (Conservative)",
+    "schedutil": "Scheduler Based",
+}
+
+# systemd-logind D-Bus service that implements power actions
+LOGIND_BUS_NAME = "org.freedesktop.login1"
+
+
+def _get_logind():
+    """
+    Get a proxy for the systemd-logind manager on the system bus.
+
+    Returns:
+        logind manager proxy or None if D-Bus or logind is unavailable
+    """
+    try:
+        from pydbus import SystemBus
+        return SystemBus().get(LOGIND_BUS_NAME)
+    except Exception as e:
+        logger.debug(f"systemd-logind is not available over D-Bus: {e}")
+        return None
+
+
+def _logind_call(method: str, *args) -> bool:
+    """
+    Call a systemd-logind manager method directly over D-Bus.
+
+    Args:
+        method: Name of the logind manager method (e.g. PowerOff)
+        *args: Arguments passed to the method
+
+    Returns:
+        True if the call succeeded, False otherwise
+    """
+    logind = _get_logind()
+    if logind is None:
+        return False
+    
+    try:
+        getattr(logind, method)(*args)
+        return True
+    except Exception as e:
+        logger.debug(f"logind {method} call failed: {e}")
+        return False
+
+
+# File where systemd records a pending scheduled shutdown
+SCHEDULED_SHUTDOWN_FILE = "/run/systemd/shutdown/scheduled"
+
+# Directory listing all power supplies (AC adapters, batteries, ...)
+POWER_SUPPLY_DIR = "/sys/class/power_supply"
+
+# Directory holding per-CPU sysfs entries
+CPU_DIR = "/sys/devices/system/cpu"
+
+# sysfs attributes read here are a few bytes long
+SYSFS_READ_SIZE = 128
+
+
+def _read_sysfs(path: str, dir_fd: Optional[int] = None) -> Optional[bytes]:
+    """
+    Read a small sysfs attribute with a single raw read.
+
+    Args:
+        path: Path to the sysfs attribute
+        dir_fd: Directory descriptor that a relative path is resolved against
+
+    Returns:
+        Stripped attribute contents or None if the attribute cannot be read
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+    except OSError:
+        return None
+    
+    try:
+        return os.read(fd, SYSFS_READ_SIZE).strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _write_sysfs(path: str, data: bytes) -> None:
+    """
+    Write a small sysfs attribute with a single raw write.
+
+    Args:
+        path: Path to the sysfs attribute
+        data: Value to write
+
+    Raises:
+        OSError: If the attribute cannot be written
+    """
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.pwrite(fd, data, 0)
+    finally:
+        os.close(fd)
+
+
+def _present_cpus() -> List[int]:
+    """
+    Get the numbers of the CPUs present in the system.
+
+    Parses the CPU range list in /sys/devices/system/cpu/present
+    (e.g. "0-3,6") and only scans the CPU directory if it is missing.
+
+    Returns:
+        Sorted list of CPU numbers
+    """
+    present = _read_sysfs(f"{CPU_DIR}/present")
+    if not present:
+        try:
+            with os.scandir(CPU_DIR) as entries:
+                return sorted(
+                    int(entry.name[3:]) for entry in entries
+                    if entry.name.startswith("cpu") and entry.name[3:].isdigit()
+                    and entry.is_dir(follow_symlinks=False)
+                )
+        except OSError:
+            return []
+    
+    cpus = []
+    for part in present.decode().split(","):
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def _governor_paths() -> List[str]:
+    """
+    Get the CPU scaling_governor files.
+
+    CPUs in the same frequency domain share a cpufreq policy, so the
+    per-policy files are used when present, falling back to one file per CPU.
+
+    Returns:
+        List of scaling_governor file paths
+    """
+    policy_paths = sorted(glob.glob(f"{CPU_DIR}/cpufreq/policy*/scaling_governor"))
+    if policy_paths:
+        return policy_paths
+    
+    cpu_paths = (f"{CPU_DIR}/cpu{n}/cpufreq/scaling_governor" for n in _present_cpus())
+    return [path for path in cpu_paths if os.path.exists(path)]
 
 
 @register_command
@@ -23,6 +242,77 @@ class PowerCommand(BaseCommand):
     name = "power"
     help = "Manage system power"
 
+    # Subcommand name -> (help, [(argument flags, add_argument options), ...])
+    _SUBCOMMANDS = {
+        "off": ("Power off the system", [
+            (("--now", "-n"), {
+                "action": "store_true",
+                "help": "Power off immediately without confirmation",
+            }),
+            (("--time", "-t"), {
+                "type": int,
+                "default": 0,
+                "help": "Schedule power off after specified minutes",
+            }),
+        ]),
+        "reboot": ("Reboot the system", [
+            (("--now", "-n"), {
+                "action": "store_true",
+                "help": "Reboot immediately without confirmation",
+            }),
+        ]),
+        "suspend": ("Suspend the system", [
+            (("--now", "-n"), {
+                "action": "store_true",
+                "help": "Suspend immediately without confirmation",
+            }),
+        ]),
+        "hibernate": ("Hibernate the system", [
+            (("--now", "-n"), {
+                "action": "store_true",
+                "help": "Hibernate immediately without confirmation",
+            }),
+        ]),
+        "hybrid-sleep": ("Hybrid sleep the system", [
+            (("--now", "-n"), {
+                "action": "store_true",
+                "help": "Hybrid sleep immediately without confirmation",
+            }),
+        ]),
+        "lock": ("Lock the screen", []),
+        "status": ("Show power status", [
+            (("--remaining-time", "-r"), {
+                "action": "store_true",
+                "help": "Estimate remaining battery time (slower on some hardware)",
+            }),
+        ]),
+        "cancel": ("Cancel scheduled power off", []),
+        "profile": ("Set or view power profile", [
+            (("mode",), {
+                "nargs": "?",
+                "choices": ["performance", "balanced", "power-saver", "auto"],
+                "help": "Power profile mode (omit to show current profile)",
+            }),
+        ]),
+    }
+
+    def __init__(self) -> None:
+        """
+        Initialize command.
+        """
+        super().__init__()
+        self._dispatch = {
+            "off": lambda a: self._power_off(a.now, a.time),
+            "reboot": lambda a: self._run_power_action("reboot", a.now),
+            "suspend": lambda a: self._run_power_action("suspend", a.now),
+            "hibernate": lambda a: self._run_power_action("hibernate", a.now),
+            "hybrid-sleep": lambda a: self._run_power_action("hybrid-sleep", a.now),
+            "lock": lambda a: self._lock_screen(),
+            "status": lambda a: self._show_power_status(a.remaining_time),
+            "cancel": lambda a: self._cancel_scheduled_power_off(),
+            "profile": lambda a: self._manage_power_profile(a.mode),
+        }
+
     def _setup_arguments(self, parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         """
         Set up command arguments.
@@ -36,69 +326,18 @@ class PowerCommand(BaseCommand):
         self.parser = parser  # Save the parser for later use
         subparsers = parser.add_subparsers(dest="subcommand")
         
-        # Power off command
-        off_parser = subparsers.add_parser("off", help="Power off the system")
-        off_parser.add_argument(
-            "--now", "-n",
-            action="store_true",
-            help="Power off immediately without confirmation"
-        )
-        off_parser.add_argument(
-            "--time", "-t",
-            type=int,
-            default=0,
-            help="Schedule power off after specified minutes"
-        )
-        
-        # Reboot command
-        reboot_parser = subparsers.add_parser("reboot", help="Reboot the system")
-        reboot_parser.add_argument(
-            "--now", "-n",
-            action="store_true",
-            help="Reboot immediately without confirmation"
-        )
-        
-        # Suspend command
-        suspend_parser = subparsers.add_parser("suspend", help="Suspend the system")
-        suspend_parser.add_argument(
-            "--now", "-n",
-            action="store_true",
-            help="Suspend immediately without confirmation"
-        )
-        
-        # Hibernate command
-        hibernate_parser = subparsers.add_parser("hibernate", help="Hibernate the system")
-        hibernate_parser.add_argument(
-            "--now", "-n",
-            action="store_true",
-            help="Hibernate immediately without confirmation"
-        )
-        
-        # Hybrid sleep command
-        hybrid_sleep_parser = subparsers.add_parser("hybrid-sleep", help="Hybrid sleep the system")
-        hybrid_sleep_parser.add_argument(
-            "--now", "-n",
-            action="store_true",
-            help="Hybrid sleep immediately without confirmation"
-        )
-        
-        # Lock screen command
-        lock_parser = subparsers.add_parser("lock", help="Lock the screen")
-        
-        # Show power status command
-        status_parser = subparsers.add_parser("status", help="Show power status")
-        
-        # Cancel scheduled power off command
-        cancel_parser = subparsers.add_parser("cancel", help="Cancel scheduled power off")
-        
-        # Power profile command
-        profile_parser = subparsers.add_parser("profile", help="Set or view power profile")
-        profile_parser.add_argument(
-            "mode", 
-            nargs="?",
-            choices=["performance", "balanced", "power-saver", "auto"],
-            help="Power profile mode (omit to show current profile)"
-        )
+        # Only build the requested subcommand; build all of them for help/usage
+        requested = self._requested_subcommand(self._SUBCOMMANDS)
+        
+        for name, (help_text, arguments) in self._SUBCOMMANDS.items():
+            if requested and name != requested:
+                continue
+            
+            subparser = subparsers.add_parser(name, help=help_text)
+            for flags, options in arguments:
+                subparser.add_argument(*flags, **options)
+        
+        return parser
 
     def handle(self, args: argparse.Namespace) -> int:
         """
@@ -115,26 +354,11 @@ class PowerCommand(BaseCommand):
             return 0
         
         # Handle subcommands
-        if args.subcommand == "off":
-            self._power_off(args.now, args.time)
-        elif args.subcommand == "reboot":
-            self._reboot(args.now)
-        elif args.subcommand == "suspend":
-            self._suspend(args.now)
-        elif args.subcommand == "hibernate":
-            self._hibernate(args.now)
-        elif args.subcommand == "hybrid-sleep":
-            self._hybrid_sleep(args.now)
-        elif args.subcommand == "lock":
-            self._lock_screen()
-        elif args.subcommand == "status":
-            self._show_power_status()
-        elif args.subcommand == "cancel":
-            self._cancel_scheduled_power_off()
-        elif args.subcommand == "profile":
-            self._manage_power_profile(args.mode)
-            
-        return 0
+        handler = self._dispatch.get(args.subcommand)
+        if handler is None:
+            return 0
+        
+        return handler(args) or 0
     
     def _power_off(self, now: bool = False, wait_time: int = 0) -> None:
         """
@@ -148,128 +372,63 @@ class PowerCommand(BaseCommand):
             # Schedule power off
             return self._schedule_power_off(wait_time)
         
-        if not now:
-            # Prompt for confirmation
-            print("Are you sure you want to power off the system? (y/n) ", end="")
-            response = input().strip().lower()
-            
-            if response not in ["y", "yes"]:
-                print("Power off cancelled.")
-                return
-        
-        logger.info("Powering off the system")
-        print("Powering off the system...")
-        
-        # Check if we have systemctl
-        if check_command_exists("systemctl"):
-            run_command(["systemctl", "poweroff"])
-        else:
-            # Fallback to traditional commands
-            run_command(["sudo", "shutdown", "-h", "now"])
+        self._run_power_action("off", now)
     
-    def _reboot(self, now: bool = False) -> None:
+    def _run_power_action(self, action: str, now: bool = False) -> None:
         """
-        Reboot the system.
+        Run a power state change such as reboot or suspend.
 
         Args:
-            now: Whether to reboot immediately without confirmation
+            action: Key into POWER_ACTIONS (off, reboot, suspend, ...)
+            now: Whether to act immediately without confirmation
         """
-        if not now:
-            # Prompt for confirmation
-            print("Are you sure you want to reboot the system? (y/n) ", end="")
-            response = input().strip().lower()
-            
-            if response not in ["y", "yes"]:
-                print("Reboot cancelled.")
-                return
+        verb, progress, logind_method, systemctl_verb, fallback_cmd = POWER_ACTIONS[action]
         
-        logger.info("Rebooting the system")
-        print("Rebooting the system...")
+        if not now and not self._confirm(f"{verb.lower()} the system"):
+            print(f"{verb} cancelled.")
+            return
         
-        # Check if we have systemctl
-        if check_command_exists("systemctl"):
-            run_command(["systemctl", "reboot"])
-        else:
-            # Fallback to traditional commands
-            run_command(["sudo", "shutdown", "-r", "now"])
-    
-    def _suspend(self, now: bool = False) -> None:
-        """
-        Suspend the system.
-
-        Args:
-            now: Whether to suspend immediately without confirmation
-        """
-        if not now:
-            # Prompt for confirmation
-            print("Are you sure you want to suspend the system? (y/n) ", end="")
-            response = input().strip().lower()
-            
-            if response not in ["y", "yes"]:
-                print("Suspend cancelled.")
-                return
+        logger.info(f"{progress} the system")
+        print(f"{progress} the system...")
         
-        logger.info("Suspending the system")
-        print("Suspending the system...")
+        # Ask systemd-logind directly, without spawning systemctl
+        if _logind_call(logind_method, False):
+            return
         
-        # Check if we have systemctl
-        if check_command_exists("systemctl"):
-            run_command(["systemctl", "suspend"])
+        # systemctl can still go through polkit authentication, so prefer it
+        # over the traditional commands
+        if has_command("systemctl"):
+            run_command(["systemctl", systemctl_verb])
         else:
             # Fallback to traditional commands
-            run_command(["sudo", "pm-suspend"])
+            run_command(fallback_cmd)
     
-    def _hibernate(self, now: bool = False) -> None:
+    def _confirm(self, action: str) -> bool:
         """
-        Hibernate the system.
+        Ask the user to confirm an action with a single keypress.
 
         Args:
-            now: Whether to hibernate immediately without confirmation
-        """
-        if not now:
-            # Prompt for confirmation
-            print("Are you sure you want to hibernate the system? (y/n) ", end="")
-            response = input().strip().lower()
-            
-            if response not in ["y", "yes"]:
-                print("Hibernate cancelled.")
-                return
-        
-        logger.info("Hibernating the system")
-        print("Hibernating the system...")
-        
-        # Check if we have systemctl
-        if check_command_exists("systemctl"):
-            run_command(["systemctl", "hibernate"])
-        else:
-            # Fallback to traditional commands
-            run_command(["sudo", "pm-hibernate"])
-    
-    def _hybrid_sleep(self, now: bool = False) -> None:
-        """
-        Hybrid sleep the system.
+            action: Description of the action (e.g. "reboot the system")
 
-        Args:
-            now: Whether to hybrid sleep immediately without confirmation
+        Returns:
+            True if the user confirmed, False otherwise
         """
-        if not now:
-            # Prompt for confirmation
-            print("Are you sure you want to hybrid sleep the system? (y/n) ", end="")
-            response = input().strip().lower()
-            
-            if response not in ["y", "yes"]:
-                print("Hybrid sleep cancelled.")
-                return
+        print(f"Are you sure you want to {action}? (y/n) ", end="", flush=True)
         
-        logger.info("Hybrid sleeping the system")
-        print("Hybrid sleeping the system...")
+        # Fall back to a raw line read when input is piped; only the first byte matters
+        if not sys.stdin.isatty():
+            return sys.stdin.buffer.readline().lstrip()[:1] in (b"y", b"Y")
         
-        # Check if we have systemctl
-        if check_command_exists("systemctl"):
-            run_command(["systemctl", "hybrid-sleep"])
-        else:
-            # Fallback to traditional commands
-            run_command(["sudo", "pm-suspend-hybrid"])
+        fd = sys.stdin.fileno()
+        old_settings = termios.tcgetattr(fd)
+        try:
+            tty.setraw(fd)
+            response = sys.stdin.read(1).lower()
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+        
+        print(response)
+        return response == "y"
     
     def _lock_screen(self) -> None:
         """
@@ -278,17 +437,11 @@ class PowerCommand(BaseCommand):
         logger.info("Locking the screen")
         print("Locking the screen...")
         
-        # Try multiple lock methods in order of preference
-        lock_methods = [
-            ["i3lock"],
-            ["xscreensaver-command", "-lock"],
-            ["gnome-screensaver-command", "--lock"],
-            ["loginctl", "lock-session"],
-            ["xdg-screensaver", "lock"]
-        ]
-        
-        for lock_cmd in lock_methods:
-            if check_command_exists(lock_cmd[0]):
+        # Use the most preferred lock command that is installed
+        lock_command = _first_on_path([lock_cmd[0] for lock_cmd in LOCK_COMMANDS])
+        
+        for lock_cmd in LOCK_COMMANDS:
+            if lock_cmd[0] == lock_command:
                 run_command(lock_cmd)
                 return
         
@@ -310,31 +463,31 @@ class PowerCommand(BaseCommand):
         logger.info(f"Scheduling power off in {minutes} minutes")
         print(f"Scheduling power off in {minutes} minutes...")
         
-        # Check if we have systemctl
-        if check_command_exists("shutdown"):
+        # Schedule through systemd-logind (CLOCK_REALTIME in microseconds)
+        usec = int((time.time() + minutes * 60) * 1000000)
+        if _logind_call("ScheduleShutdown", "poweroff", usec):
+            print(f"System will power off at {self._get_shutdown_time(minutes)}.")
+            print("Run 'i3ctl power cancel' to cancel the scheduled power off.")
+        elif has_command("shutdown"):
             run_command(["sudo", "shutdown", "-h", f"+{minutes}"])
             print(f"System will power off at {self._get_shutdown_time(minutes)}.")
             print("Run 'i3ctl power cancel' to cancel the scheduled power off.")
-        elif check_command_exists("at"):
+        elif has_command("at"):
             # Try to use the 'at' command as a fallback
             time_str = f"now + {minutes} minutes"
-            process = subprocess.Popen(
+            process = subprocess.run(
                 ["at", time_str],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                input=b"systemctl poweroff\n",
+                capture_output=True,
+                check=False
             )
-            process.stdin.write(b"systemctl poweroff\n")
-            process.stdin.close()
-            
-            stdout, stderr = process.communicate()
             
             if process.returncode == 0:
                 print(f"System will power off at {self._get_shutdown_time(minutes)}.")
                 print("Run 'i3ctl power cancel' to cancel the scheduled power off.")
             else:
-                logger.error(f"Failed to schedule power off: {stderr.decode()}")
-                print(f"Error: Failed to schedule power off: {stderr.decode()}")
+                logger.error(f"Failed to schedule power off: {process.stderr.decode()}")
+                print(f"Error: Failed to schedule power off: {process.stderr.decode()}")
         else:
             logger.error("No command found to schedule power off")
             print("Error: No command found to schedule power off.")
@@ -347,11 +500,12 @@ class PowerCommand(BaseCommand):
         logger.info("Cancelling scheduled power off")
         print("Cancelling scheduled power off...")
         
-        # Check if we have systemctl
-        if check_command_exists("shutdown"):
+        if _logind_call("CancelScheduledShutdown"):
+            print("Scheduled power off has been cancelled.")
+        elif has_command("shutdown"):
             run_command(["sudo", "shutdown", "-c"])
             print("Scheduled power off has been cancelled.")
-        elif check_command_exists("at"):
+        elif has_command("at"):
             # Try to use the 'at' command as a fallback
             # This is tricky since we need to find the job ID
             run_command(["atq"])
@@ -361,14 +515,17 @@ class PowerCommand(BaseCommand):
             print("Error: No command found to cancel scheduled power off.")
             print("Please install 'at' or make sure 'shutdown' is available.")
     
-    def _show_power_status(self) -> None:
+    def _show_power_status(self, show_remaining: bool = False) -> None:
         """
         Show power status.
+
+        Args:
+            show_remaining: Whether to estimate remaining battery time
         """
         print("Power Status:")
         
         # Battery status
-        self._show_battery_status()
+        self._show_battery_status(show_remaining)
         
         # Scheduled shutdowns
         self._show_scheduled_shutdowns()
@@ -377,45 +534,56 @@ class PowerCommand(BaseCommand):
         self._show_cpu_info()
         
         # Power profile (checks for ppd, tlp, and CPU governor)
-        ppd_available = check_command_exists("powerprofilesctl")
-        tlp_available = check_command_exists("tlp-stat") and check_command_exists("tlp")
+        ppd_available = has_command("powerprofilesctl")
+        tlp_available = has_command("tlp")
         cpu_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
         cpu_control_available = os.path.exists(cpu_path)
         
         self._show_power_profile(ppd_available, tlp_available, cpu_control_available)
     
-    def _show_battery_status(self) -> None:
+    def _show_battery_status(self, show_remaining: bool = False) -> None:
         """
         Show battery status.
-        """
-        # Check if we have the battery
-        battery_path = "/sys/class/power_supply/BAT0"
-        if not os.path.exists(battery_path):
-            battery_path = "/sys/class/power_supply/BAT1"
-            if not os.path.exists(battery_path):
-                print("  Battery: Not found")
-                return
+
+        Args:
+            show_remaining: Whether to estimate remaining time; reading the
+                current and energy counters can stall on the embedded controller
+        """
+        # Find the first battery that reports a status
+        battery_fd = None
+        for battery_path in self._find_batteries():
+            try:
+                battery_fd = os.open(battery_path, os.O_PATH | os.O_DIRECTORY)
+            except OSError:
+                continue
+            
+            status = _read_sysfs("status", dir_fd=battery_fd)
+            if status is not None:
+                break
+            
+            os.close(battery_fd)
+            battery_fd = None
+        
+        if battery_fd is None:
+            print("  Battery: Not found")
+            return
         
-        # Read battery status
+        # Read battery status relative to the battery directory
         try:
-            with open(f"{battery_path}/status", "r") as f:
-                status = f.read().strip()
-            
-            with open(f"{battery_path}/capacity", "r") as f:
-                capacity = int(f.read().strip())
+            status = status.decode()
+            capacity = int(_read_sysfs("capacity", dir_fd=battery_fd))
             
             # Get charging status
             is_charging = status == "Charging"
             is_discharging = status == "Discharging"
             
-            # Get remaining time if available
+            # Get remaining time if requested and available
             remaining_time = "Unknown"
-            if os.path.exists(f"{battery_path}/current_now") and is_discharging:
-                with open(f"{battery_path}/current_now", "r") as f:
-                    current = int(f.read().strip()) / 1000000  # µA to A
-                
-                with open(f"{battery_path}/energy_now", "r") as f:
-                    energy = int(f.read().strip()) / 1000000  # µWh to Wh
+            show_remaining = show_remaining and is_discharging
+            current_now = _read_sysfs("current_now", dir_fd=battery_fd) if show_remaining else None
+            if current_now is not None:
+                current = int(current_now) / 1000000  # µA to A
+                energy = int(_read_sysfs("energy_now", dir_fd=battery_fd)) / 1000000  # µWh to Wh
                 
                 if current > 0:
                     hours = energy / current
@@ -426,29 +594,50 @@ class PowerCommand(BaseCommand):
             status_str = "Charging" if is_charging else "Discharging" if is_discharging else status
             print(f"  Battery: {capacity}% ({status_str})")
             
-            if is_discharging:
+            if show_remaining:
                 print(f"  Remaining time: {remaining_time}")
             
         except Exception as e:
             logger.error(f"Failed to read battery status: {e}")
             print("  Battery: Error reading status")
+        finally:
+            os.close(battery_fd)
+    
+    def _find_batteries(self) -> List[str]:
+        """
+        Find battery power supplies.
+
+        Returns:
+            Sorted list of battery sysfs paths
+        """
+        try:
+            with os.scandir(POWER_SUPPLY_DIR) as entries:
+                return sorted(
+                    entry.path for entry in entries
+                    if entry.name.startswith("BAT") or _read_sysfs(f"{entry.path}/type") == b"Battery"
+                )
+        except OSError:
+            return []
     
     def _show_scheduled_shutdowns(self) -> None:
         """
         Show scheduled shutdowns.
         """
-        # Check if there's a scheduled shutdown
-        if check_command_exists("shutdown"):
-            return_code, stdout, stderr = run_command(["shutdown", "-c"], capture_stderr=True)
-            
-            if "No scheduled shutdown" not in stderr:
-                # Extract scheduled shutdown time
-                import re
-                match = re.search(r"Shutdown scheduled for (.*)", stderr)
-                if match:
-                    time_str = match.group(1)
-                    print(f"  Scheduled shutdown: {time_str}")
-                    return
+        # systemd records a pending shutdown as KEY=value lines, e.g. USEC= and MODE=
+        try:
+            with open(SCHEDULED_SHUTDOWN_FILE, "r") as f:
+                scheduled = dict(line.strip().split("=", 1) for line in f if "=" in line)
+        except FileNotFoundError:
+            scheduled = {}
+        except Exception as e:
+            logger.debug(f"Failed to read scheduled shutdown: {e}")
+            scheduled = {}
+        
+        if scheduled.get("USEC", "").isdigit():
+            when = datetime.datetime.fromtimestamp(int(scheduled["USEC"]) / 1000000)
+            mode = scheduled.get("MODE", "poweroff")
+            print(f"  Scheduled shutdown: {when.strftime('%c')} ({mode})")
+            return
         
         print("  Scheduled shutdown: None")
     
@@ -456,19 +645,17 @@ class PowerCommand(BaseCommand):
         """
         Show CPU frequency and governor.
         """
-        # Check if we have the cpufreq files
         cpu_path = "/sys/devices/system/cpu/cpu0/cpufreq"
-        if not os.path.exists(cpu_path):
-            print("  CPU governor: Unknown")
-            return
         
         # Read CPU governor
         try:
-            with open(f"{cpu_path}/scaling_governor", "r") as f:
-                governor = f.read().strip()
+            governor = _read_sysfs(f"{cpu_path}/scaling_governor")
+            if governor is None:
+                print("  CPU governor: Unknown")
+                return
             
-            with open(f"{cpu_path}/scaling_cur_freq", "r") as f:
-                freq = int(f.read().strip()) / 1000  # kHz to MHz
+            governor = governor.decode()
+            freq = int(_read_sysfs(f"{cpu_path}/scaling_cur_freq")) / 1000  # kHz to MHz
             
             print(f"  CPU governor: {governor}")
             print(f"  CPU frequency: {freq:.0f} MHz")
@@ -487,7 +674,6 @@ class PowerCommand(BaseCommand):
         Returns:
             Time string
         """
-        import datetime
         shutdown_time = datetime.datetime.now() + datetime.timedelta(minutes=minutes)
         return shutdown_time.strftime("%H:%M")
         
@@ -499,10 +685,10 @@ class PowerCommand(BaseCommand):
             mode: Power profile mode to set, or None to show current profile
         """
         # First check if power-profiles-daemon is available (modern approach)
-        ppd_available = check_command_exists("powerprofilesctl")
+        ppd_available = has_command("powerprofilesctl")
         
         # Then check for TLP (common power management tool)
-        tlp_available = check_command_exists("tlp-stat") and check_command_exists("tlp")
+        tlp_available = has_command("tlp")
         
         # Finally check direct CPU control
         cpu_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
@@ -516,14 +702,7 @@ class PowerCommand(BaseCommand):
         # Set the requested profile
         if ppd_available:
             # Map our modes to power-profiles-daemon modes
-            mode_map = {
-                "performance": "performance",
-                "balanced": "balanced",
-                "power-saver": "power-saver",
-                "auto": "balanced"  # Default to balanced for auto
-            }
-            
-            ppd_mode = mode_map.get(mode, "balanced")
+            ppd_mode = MODE_TO_PPD.get(mode, "balanced")
             logger.info(f"Setting power profile to {ppd_mode} using power-profiles-daemon")
             print(f"Setting power profile to {ppd_mode}...")
             
@@ -561,43 +740,30 @@ class PowerCommand(BaseCommand):
                 
         elif cpu_control_available:
             # Map our modes to CPU governors
-            governor_map = {
-                "performance": "performance",
-                "balanced": "ondemand",
-                "power-saver": "powersave",
-                "auto": "ondemand"  # Default to ondemand for auto
-            }
-            
-            governor = governor_map.get(mode, "ondemand")
+            governor = MODE_TO_GOVERNOR.get(mode, "ondemand")
             logger.info(f"Setting CPU governor to {governor}")
             print(f"Setting CPU governor to {governor}...")
             
-            # Get all available CPU cores
-            cpu_cores = []
-            cpu_dir = "/sys/devices/system/cpu"
-            for entry in os.listdir(cpu_dir):
-                if entry.startswith("cpu") and entry[3:].isdigit():
-                    cpu_cores.append(entry)
+            # Get the governor files (one per cpufreq policy where possible)
+            governor_paths = _governor_paths()
             
-            if not cpu_cores:
+            if not governor_paths:
                 logger.error("No CPU cores found")
                 print("Error: No CPU cores found")
                 return
                 
-            # Set governor for each core
+            # Set governor for each policy or core
             success = True
-            for core in cpu_cores:
-                governor_path = f"{cpu_dir}/{core}/cpufreq/scaling_governor"
-                if os.path.exists(governor_path):
-                    try:
-                        with open(governor_path, "w") as f:
-                            f.write(governor)
-                    except (IOError, PermissionError) as e:
-                        logger.error(f"Failed to set governor for {core}: {e}")
-                        print(f"Error: Insufficient permissions to change CPU governor")
-                        print("Try running with sudo or adjust permissions")
-                        success = False
-                        break
+            data = governor.encode()
+            for governor_path in governor_paths:
+                try:
+                    _write_sysfs(governor_path, data)
+                except OSError as e:
+                    logger.error(f"Failed to set governor via {governor_path}: {e}")
+                    print("Error: Insufficient permissions to change CPU governor")
+                    print("Try running with sudo or adjust permissions")
+                    success = False
+                    break
             
             if success:
                 print(f"CPU governor set to {governor} for all cores")
@@ -621,19 +787,19 @@ class PowerCommand(BaseCommand):
         
         # Try power-profiles-daemon first
         if ppd_available:
-            return_code, stdout, stderr = run_command(["powerprofilesctl", "get"])
+            # `list` marks the active profile with "*", so one call gives both
+            return_code, stdout, stderr = run_command(["powerprofilesctl", "list"])
             
             if return_code == 0 and stdout:
-                print(f"  Current profile: {stdout.strip()}")
-                # Also show available profiles
-                return_code, stdout, stderr = run_command(["powerprofilesctl", "list"])
-                if return_code == 0 and stdout:
-                    print("  Available profiles:")
-                    for line in stdout.strip().split("\n"):
-                        if "*" in line:  # Active profile
-                            print(f"    {line.strip()}")
-                        elif line.strip() and not line.strip().startswith("Available"):
-                            print(f"    {line.strip()}")
+                lines = [line.strip() for line in stdout.strip().split("\n")]
+                current = next((line for line in lines if line.startswith("*")), None)
+                if current:
+                    print(f"  Current profile: {current.lstrip('* ').rstrip(':')}")
+                
+                print("  Available profiles:")
+                for line in lines:
+                    if line and not line.startswith("Available"):
+                        print(f"    {line}")
                 return
                 
         # Try TLP
@@ -654,17 +820,12 @@ class PowerCommand(BaseCommand):
         # Fall back to CPU governor
         if cpu_control_available:
             governors = set()
-            cpu_dir = "/sys/devices/system/cpu"
             
-            for entry in os.listdir(cpu_dir):
-                if entry.startswith("cpu") and entry[3:].isdigit():
-                    governor_path = f"{cpu_dir}/{entry}/cpufreq/scaling_governor"
-                    if os.path.exists(governor_path):
-                        try:
-                            with open(governor_path, "r") as f:
-                                governors.add(f.read().strip())
-                        except IOError:
-                            pass
+            # CPUs sharing a cpufreq policy share a governor, so read one per policy
+            for governor_path in _governor_paths():
+                governor = _read_sysfs(governor_path)
+                if governor:
+                    governors.add(governor.decode())
             
             if governors:
                 if len(governors) == 1:
@@ -672,15 +833,7 @@ class PowerCommand(BaseCommand):
                     print(f"  CPU Governor: {governor}")
                     
                     # Map governor to profile name for clarity
-                    profile_map = {
-                        "performance": "Performance",
-                        "powersave": "Power Saver",
-                        "ondemand": "Balanced (Dynamic)",
-                        "conservative": "Balanced (Conservative)",
-                        "schedutil": "Scheduler Based"
-                    }
-                    
-                    profile = profile_map.get(governor, "Unknown")
+                    profile = GOVERNOR_TO_PROFILE.get(governor, "Unknown")
                     print(f"  Profile: {profile}")
                 else:
                     print(f"  CPU Governors: {', '.join(governors)} (mixed)")
@@ -3,16 +3,133 @@ Startup application management commands.
 """
 
 import argparse
+import json
+import mmap
 import os
-import re
-from typing import Dict, List, Optional, Tuple
+import shutil
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from i3ctl.commands.base import BaseCommand
 from i3ctl.commands import register_command
 from i3ctl.utils.logger import logger
-from i3ctl.utils.config import get_i3_config_path, load_config, save_config
+from i3ctl.utils.config import CACHE_DIR, get_i3_config_path, load_config, save_config
 from i3ctl.utils.system import run_command, check_command_exists
 
+# Parsed startup commands, keyed on the config file's path, mtime and size
+STARTUP_CACHE_FILE = os.path.join(CACHE_DIR, "startup.json")
+STARTUP_CACHE_VERSION = 2
+
+# Linux-only mmap flag, exposed by the mmap module since Python 3.10. Its value
+# differs between architectures, so older Pythons simply go without it.
+MAP_POPULATE = getattr(mmap, "MAP_POPULATE", 0)
+
+
+def _read_config_lines(config_path: str, required: Optional[bytes] = None) -> Iterator[str]:
+    """
+    Iterate over the lines of a config file through a read-only memory map.
+
+    Args:
+        config_path: Path to the config file
+        required: If given, yield nothing unless the file contains this byte string
+
+    Yields:
+        Lines of the file, including line endings
+    """
+    with open(config_path, "rb") as f:
+        try:
+            # The whole file is scanned, so prefault all its pages up front
+            mapped = mmap.mmap(
+                f.fileno(), 0,
+                flags=mmap.MAP_SHARED | MAP_POPULATE,
+                prot=mmap.PROT_READ,
+            )
+        except (ValueError, OSError):
+            # Empty and special files cannot be mapped
+            for line in f:
+                yield line.decode()
+            return
+        
+        with mapped:
+            # Searching the whole buffer is far cheaper than a per-line scan
+            if required is not None and mapped.find(required) == -1:
+                return
+            
+            for line in iter(mapped.readline, b""):
+                yield line.decode()
+
+
+def _parse_exec(stripped: str, parts: List[str], parsed: Dict[str, List], state: Dict[str, Optional[str]]) -> None:
+    """
+    Record an exec line along with the comment preceding it.
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+        parts: Line split into its first token and the rest
+        parsed: Parsed startup commands to add to
+        state: Parser state holding the pending comment
+    """
+    parsed["exec_cmds"].append(parts[1] if len(parts) > 1 else "")
+    parsed["exec_comments"].append(state["comment"])
+    state["comment"] = None
+
+
+def _parse_exec_always(stripped: str, parts: List[str], parsed: Dict[str, List], state: Dict[str, Optional[str]]) -> None:
+    """
+    Record an exec_always line along with the comment preceding it.
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+        parts: Line split into its first token and the rest
+        parsed: Parsed startup commands to add to
+        state: Parser state holding the pending comment
+    """
+    parsed["exec_always_cmds"].append(parts[1] if len(parts) > 1 else "")
+    parsed["exec_always_comments"].append(state["comment"])
+    state["comment"] = None
+
+
+def _parse_comment(stripped: str, parts: List[str], parsed: Dict[str, List], state: Dict[str, Optional[str]]) -> None:
+    """
+    Record a commented-out exec command, or remember a comment for the next exec line.
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+        parts: Line split into its first token and the rest
+        parsed: Parsed startup commands to add to
+        state: Parser state holding the pending comment
+    """
+    rest = parts[1] if parts[0] == "#" and len(parts) > 1 else ""
+    if rest.startswith("exec "):
+        parsed["disabled_cmds"].append(rest[len("exec "):].strip())
+        parsed["disabled_always"].append(False)
+    elif rest.startswith("exec_always "):
+        parsed["disabled_cmds"].append(rest[len("exec_always "):].strip())
+        parsed["disabled_always"].append(True)
+    elif not state["comment"]:
+        state["comment"] = stripped[1:].strip()
+
+
+def _parse_other(stripped: str, parts: List[str], parsed: Dict[str, List], state: Dict[str, Optional[str]]) -> None:
+    """
+    Handle any other line; only comments without a space after "#" matter here.
+
+    Args:
+        stripped: Line with surrounding whitespace removed
+        parts: Line split into its first token and the rest
+        parsed: Parsed startup commands to add to
+        state: Parser state holding the pending comment
+    """
+    if parts[0].startswith("#"):
+        _parse_comment(stripped, parts, parsed, state)
+
+
+# Line handlers keyed on the first token of a config line
+LINE_PARSERS = {
+    "exec": _parse_exec,
+    "exec_always": _parse_exec_always,
+    "#": _parse_comment,
+}
+
 
 @register_command
 class StartupCommand(BaseCommand):
@@ -103,17 +220,7 @@ class StartupCommand(BaseCommand):
             always: Whether to use exec_always (True) or exec (False)
             comment: Optional comment to add
         """
-        # Read the config file
-        with open(config_path, "r") as f:
-            config_lines = f.readlines()
-        
-        # Check if command already exists
-        command_pattern = f"^(exec(_always)?) {re.escape(command)}$"
-        for line in config_lines:
-            if re.search(command_pattern, line.strip()):
-                logger.warning(f"Command already exists in config: {command}")
-                print(f"Command already exists in config: {command}")
-                return
+        targets = (f"exec {command}", f"exec_always {command}")
         
         # Prepare new line
         exec_type = "exec_always" if always else "exec"
@@ -122,24 +229,55 @@ class StartupCommand(BaseCommand):
         if comment:
             new_line = f"# {comment}\n{new_line}"
         
-        # Find the best place to add the command
-        # Look for existing exec or exec_always lines
-        last_exec_index = -1
-        for i, line in enumerate(config_lines):
-            if line.strip().startswith("exec") or line.strip().startswith("# exec"):
-                last_exec_index = i
-        
-        if last_exec_index >= 0:
-            # Add after the last exec line
-            config_lines.insert(last_exec_index + 1, new_line)
-        else:
-            # Add at the end of the file
-            config_lines.append("\n# Startup applications\n")
-            config_lines.append(new_line)
+        # Stream the config into a temp file, inserting the new line after the
+        # last exec line. Only lines seen since the most recent exec line are
+        # held back, since the insertion point can't be past them yet.
+        config_path = os.path.realpath(config_path)
+        tmp_path = f"{config_path}.tmp"
+        pending = []
+        found_exec = False
         
-        # Write the updated config file
-        with open(config_path, "w") as f:
-            f.writelines(config_lines)
+        try:
+            with open(tmp_path, "w") as f:
+                for line in _read_config_lines(config_path):
+                    # Only exec lines can match, so the full strip is deferred to them
+                    head = line.lstrip()
+                    
+                    if head.startswith(("exec", "# exec")):
+                        # Check if command already exists
+                        if head.rstrip() in targets:
+                            logger.warning(f"Command already exists in config: {command}")
+                            print(f"Command already exists in config: {command}")
+                            os.remove(tmp_path)
+                            return
+                        
+                        f.writelines(pending)
+                        pending.clear()
+                        f.write(line)
+                        found_exec = True
+                    elif found_exec:
+                        pending.append(line)
+                    else:
+                        f.write(line)
+                
+                if found_exec:
+                    # Add after the last exec line
+                    f.write(new_line)
+                    f.writelines(pending)
+                else:
+                    # Add at the end of the file
+                    f.write("\n# Startup applications\n")
+                    f.write(new_line)
+            
+            shutil.copymode(config_path, tmp_path)
+            os.replace(tmp_path, config_path)
+        except (OSError, ValueError) as e:
+            # ValueError covers a config that is not valid UTF-8
+            logger.error(f"Failed to update i3 config: {e}")
+            print(f"Error: Failed to update i3 config: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
         
         logger.info(f"Added startup command: {command}")
         print(f"Added startup command: {command}")
@@ -155,34 +293,34 @@ class StartupCommand(BaseCommand):
             config_path: Path to i3 config file
             command: Command to remove
         """
-        # Read the config file
-        with open(config_path, "r") as f:
-            config_lines = f.readlines()
+        targets = (f"exec {command}", f"exec_always {command}")
         
-        # Find all lines with the command
-        command_pattern = f"^(exec(_always)?) {re.escape(command)}$"
-        matching_indices = []
+        # Copy the config in a single pass, dropping the command and any
+        # lone comment directly above it
+        config_lines = []
+        found = False
+        prev_comment = False
+        prev_prev_comment = False
         
-        for i, line in enumerate(config_lines):
-            if re.search(command_pattern, line.strip()):
-                matching_indices.append(i)
+        for line in _read_config_lines(config_path):
+            is_comment = line.lstrip().startswith("#")
+            
+            if not is_comment and line.strip() in targets:
+                found = True
+                # Also remove the comment if it's not part of another section
+                if prev_comment and not prev_prev_comment:
+                    config_lines.pop()
+            else:
+                config_lines.append(line)
+            
+            prev_prev_comment = prev_comment
+            prev_comment = is_comment
         
-        if not matching_indices:
+        if not found:
             logger.warning(f"Command not found in config: {command}")
             print(f"Command not found in config: {command}")
             return
         
-        # Remove the commands and any associated comments
-        for index in sorted(matching_indices, reverse=True):
-            # Remove the line
-            config_lines.pop(index)
-            
-            # Check if the previous line is a comment
-            if index > 0 and config_lines[index - 1].strip().startswith("#"):
-                # Also remove the comment if it's not part of another section
-                if index - 1 == 0 or not config_lines[index - 2].strip().startswith("#"):
-                    config_lines.pop(index - 1)
-        
         # Write the updated config file
         with open(config_path, "w") as f:
             f.writelines(config_lines)
@@ -201,77 +339,107 @@ class StartupCommand(BaseCommand):
             config_path: Path to i3 config file
             show_all: Whether to show commented (disabled) commands
         """
-        # Read the config file
-        with open(config_path, "r") as f:
-            config_lines = f.readlines()
-        
-        # Extract exec and exec_always lines
-        exec_lines = []
-        exec_always_lines = []
-        commented_lines = []
-        
-        # Also extract comments that precede exec lines
-        current_comment = None
-        
-        for line in config_lines:
-            stripped = line.strip()
-            
-            if stripped.startswith("#"):
-                # Store potential comment
-                if not current_comment:
-                    current_comment = stripped[1:].strip()
-                continue
-            
-            if not stripped:
-                # Reset comment on empty line
-                current_comment = None
-                continue
-            
-            if stripped.startswith("exec "):
-                exec_lines.append((stripped, current_comment))
-                current_comment = None
-            elif stripped.startswith("exec_always "):
-                exec_always_lines.append((stripped, current_comment))
-                current_comment = None
-            elif show_all and stripped.startswith("# exec"):
-                # This is a commented-out exec command
-                clean_line = stripped[1:].strip()
-                commented_lines.append((clean_line, None))
+        commands = self._get_startup_commands(config_path)
         
         # Print results
-        if not exec_lines and not exec_always_lines and (not commented_lines or not show_all):
+        if not commands["exec_cmds"] and not commands["exec_always_cmds"] and (not commands["disabled_cmds"] or not show_all):
             print("No startup commands found.")
             return
         
         # Print exec_always commands
-        if exec_always_lines:
+        if commands["exec_always_cmds"]:
             print("\nRun on every startup (exec_always):")
-            for cmd, comment in exec_always_lines:
-                cmd_str = cmd[len("exec_always "):].strip()
+            for cmd_str, comment in zip(commands["exec_always_cmds"], commands["exec_always_comments"]):
                 if comment:
                     print(f"- {cmd_str}  # {comment}")
                 else:
                     print(f"- {cmd_str}")
         
         # Print exec commands
-        if exec_lines:
+        if commands["exec_cmds"]:
             print("\nRun once on startup (exec):")
-            for cmd, comment in exec_lines:
-                cmd_str = cmd[len("exec "):].strip()
+            for cmd_str, comment in zip(commands["exec_cmds"], commands["exec_comments"]):
                 if comment:
                     print(f"- {cmd_str}  # {comment}")
                 else:
                     print(f"- {cmd_str}")
         
         # Print commented (disabled) commands
-        if show_all and commented_lines:
+        if show_all and commands["disabled_cmds"]:
             print("\nDisabled startup commands (commented out):")
-            for cmd, _ in commented_lines:
-                if cmd.startswith("exec_always "):
-                    cmd_str = cmd[len("exec_always "):].strip()
-                    print(f"- {cmd_str} (always)")
-                elif cmd.startswith("exec "):
-                    cmd_str = cmd[len("exec "):].strip()
-                    print(f"- {cmd_str} (once)")
-                else:
-                    print(f"- {cmd}")
\ No newline at end of file
+            for cmd_str, always in zip(commands["disabled_cmds"], commands["disabled_always"]):
+                print(f"- {cmd_str} ({'always' if always else 'once'})")
+    
+    def _get_startup_commands(self, config_path: str) -> Dict[str, List]:
+        """
+        Get parsed startup commands, reusing the cached result if the config is unchanged.
+
+        Args:
+            config_path: Path to i3 config file
+
+        Returns:
+            Parsed startup commands as returned by _parse_startup_commands
+        """
+        st = os.stat(config_path)
+        key = [STARTUP_CACHE_VERSION, os.path.abspath(config_path), st.st_mtime_ns, st.st_size]
+        
+        try:
+            with open(STARTUP_CACHE_FILE, "r") as f:
+                cache = json.load(f)
+            if cache.get("key") == key:
+                return cache["commands"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        
+        commands = self._parse_startup_commands(config_path)
+        
+        # Write the cache atomically so concurrent readers never see a partial file
+        tmp_path = f"{STARTUP_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"key": key, "commands": commands}, f)
+            os.replace(tmp_path, STARTUP_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"Failed to write startup cache: {e}")
+        
+        return commands
+    
+    def _parse_startup_commands(self, config_path: str) -> Dict[str, List]:
+        """
+        Parse startup commands from i3 config.
+
+        Args:
+            config_path: Path to i3 config file
+
+        Returns:
+            Dict of parallel lists: exec_cmds/exec_comments,
+            exec_always_cmds/exec_always_comments and disabled_cmds/disabled_always
+        """
+        # Commands are stored without their exec/exec_always prefix
+        parsed = {
+            "exec_cmds": [],
+            "exec_comments": [],
+            "exec_always_cmds": [],
+            "exec_always_comments": [],
+            "disabled_cmds": [],
+            "disabled_always": [],
+        }
+        
+        # Also extract comments that precede exec lines
+        state = {"comment": None}
+        
+        # Files without any exec lines are skipped without being parsed
+        for line in _read_config_lines(config_path, required=b"exec"):
+            stripped = line.strip()
+            
+            # Classify the line by its first token
+            parts = stripped.split(None, 1)
+            if not parts:
+                # Reset comment on empty line
+                state["comment"] = None
+                continue
+            
+            LINE_PARSERS.get(parts[0], _parse_other)(stripped, parts, parsed, state)
+        
+        return parsed
@@ -3,7 +3,7 @@ Volume control commands.
 """
 
 import argparse
-import re
+import os
 from typing import Dict, List, Optional, Tuple
 
 from i3ctl.commands.base import BaseCommand
@@ -13,6 +13,28 @@ from i3ctl.utils.config import get_config_value
 from i3ctl.utils.system import run_command, check_command_exists
 
 
+def _first_percent_int(text: str) -> Optional[int]:
+    """
+    Find the first percentage value in command output.
+
+    Args:
+        text: Output to scan
+
+    Returns:
+        Integer preceding the first "N%" token, or None if there is none
+    """
+    idx = text.find("%")
+    while idx != -1:
+        start = idx
+        while start > 0 and text[start - 1].isdigit():
+            start -= 1
+        if start < idx:
+            return int(text[start:idx])
+        idx = text.find("%", idx + 1)
+    
+    return None
+
+
 @register_command
 class VolumeCommand(BaseCommand):
     """
@@ -22,6 +44,13 @@ class VolumeCommand(BaseCommand):
     name = "volume"
     help = "Control audio volume"
 
+    # Tool found by auto-detection, shared across instances
+    _cached_tool: Optional[str] = None
+    
+    # Default PulseAudio sink, and whether "pactl get-default-sink" is supported
+    _cached_sink: Optional[str] = None
+    _has_get_default_sink: Optional[bool] = None
+
     def __init__(self) -> None:
         """
         Initialize command.
@@ -121,16 +150,23 @@ class VolumeCommand(BaseCommand):
         Returns:
             Name of detected tool or None if no tool is found
         """
+        if VolumeCommand._cached_tool:
+            return VolumeCommand._cached_tool
+        
         # Check for common volume tools
         if check_command_exists("pactl"):
             logger.info("Detected PulseAudio tool: pactl")
-            return "pulseaudio"
+            tool = "pulseaudio"
         elif check_command_exists("amixer"):
             logger.info("Detected ALSA tool: amixer")
-            return "alsa"
+            tool = "alsa"
+        else:
+            logger.error("No volume tool found")
+            return None
         
-        logger.error("No volume tool found")
-        return None
+        VolumeCommand._cached_tool = tool
+        
+        return tool
     
     def _use_pulseaudio(self, action: str, value: Optional[str] = None) -> None:
         """
@@ -140,36 +176,51 @@ class VolumeCommand(BaseCommand):
             action: Action to perform (set, up, down, get, mute)
             value: Value parameter for the action
         """
+        # Talk to PulseAudio in-process when pulsectl is installed
+        if self._use_pulsectl(action, value):
+            return
+        
         # Get default sink
         sink = self._get_default_pulseaudio_sink()
         if not sink:
             print("Error: No PulseAudio sink found")
             return
         
+        # Read the state once, before the change, and work out the result from
+        # it so pactl isn't queried again afterwards
+        volume, muted = self._get_pulseaudio_volume(sink)
+        
         if action == "set":
             cmd = ["pactl", "set-sink-volume", sink, f"{value}%"]
             msg = f"Setting volume to {value}%"
+            volume = value
         elif action == "up":
             cmd = ["pactl", "set-sink-volume", sink, f"+{value}%"]
             msg = f"Increasing volume by {value}%"
+            if volume is not None:
+                volume += value
         elif action == "down":
             cmd = ["pactl", "set-sink-volume", sink, f"-{value}%"]
             msg = f"Decreasing volume by {value}%"
+            if volume is not None:
+                volume = max(0, volume - value)
         elif action == "get":
-            volume, muted = self._get_pulseaudio_volume(sink)
-            print(f"Current volume: {volume}%")
-            print(f"Muted: {muted}")
+            self._print_pulseaudio_state(volume, muted)
             return
         elif action == "mute":
             if value == "on":
                 cmd = ["pactl", "set-sink-mute", sink, "1"]
                 msg = "Muting volume"
+                muted = True
             elif value == "off":
                 cmd = ["pactl", "set-sink-mute", sink, "0"]
                 msg = "Unmuting volume"
+                muted = False
             else:  # toggle
                 cmd = ["pactl", "set-sink-mute", sink, "toggle"]
                 msg = "Toggling mute state"
+                if muted is not None:
+                    muted = not muted
         else:
             logger.error(f"Unknown action: {action}")
             return
@@ -185,10 +236,87 @@ class VolumeCommand(BaseCommand):
             return
         
         # Show current volume after changing it
-        if action != "get":
-            volume, muted = self._get_pulseaudio_volume(sink)
-            print(f"Current volume: {volume}%")
-            print(f"Muted: {muted}")
+        self._print_pulseaudio_state(volume, muted)
+    
+    def _print_pulseaudio_state(self, volume: Optional[int], muted: Optional[bool]) -> None:
+        """
+        Print PulseAudio volume and mute state, showing unknown for values not read.
+
+        Args:
+            volume: Volume percentage or None if unknown
+            muted: Mute state or None if unknown
+        """
+        print(f"Current volume: {volume}%" if volume is not None else "Current volume: unknown")
+        print(f"Muted: {muted}" if muted is not None else "Muted: unknown")
+    
+    def _use_pulsectl(self, action: str, value: Optional[str] = None) -> bool:
+        """
+        Use the pulsectl bindings to control PulseAudio volume without spawning pactl.
+
+        Args:
+            action: Action to perform (set, up, down, get, mute)
+            value: Value parameter for the action
+
+        Returns:
+            True if the action was handled, False if pactl should be used instead
+        """
+        try:
+            import pulsectl
+        except ImportError:
+            return False
+        
+        msg = None
+        try:
+            with pulsectl.Pulse("i3ctl") as pulse:
+                sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+                volume = round(sink.volume.value_flat * 100)
+                muted = bool(sink.mute)
+                
+                # Volume changes scale or shift every channel, keeping the
+                # balance between them
+                if action == "set":
+                    msg = f"Setting volume to {value}%"
+                    channels = sink.volume
+                    if channels.value_flat > 0:
+                        scale = (value / 100.0) / channels.value_flat
+                        channels.values = [level * scale for level in channels.values]
+                    else:
+                        channels.value_flat = value / 100.0
+                    pulse.volume_set(sink, channels)
+                    volume = value
+                elif action == "up":
+                    msg = f"Increasing volume by {value}%"
+                    pulse.volume_change_all_chans(sink, value / 100.0)
+                    volume = round(sink.volume.value_flat * 100)
+                elif action == "down":
+                    msg = f"Decreasing volume by {value}%"
+                    pulse.volume_change_all_chans(sink, -value / 100.0)
+                    volume = round(sink.volume.value_flat * 100)
+                elif action == "mute":
+                    if value == "on":
+                        msg = "Muting volume"
+                        muted = True
+                    elif value == "off":
+                        msg = "Unmuting volume"
+                        muted = False
+                    else:  # toggle
+                        msg = "Toggling mute state"
+                        muted = not muted
+                    pulse.mute(sink, muted)
+                elif action != "get":
+                    logger.error(f"Unknown action: {action}")
+                    return True
+        except pulsectl.PulseError as e:
+            logger.debug(f"pulsectl unavailable, falling back to pactl: {e}")
+            return False
+        
+        if msg:
+            logger.info(msg)
+            print(msg)
+        
+        print(f"Current volume: {volume}%")
+        print(f"Muted: {muted}")
+        return True
     
     def _get_default_pulseaudio_sink(self) -> Optional[str]:
         """
@@ -197,11 +325,19 @@ class VolumeCommand(BaseCommand):
         Returns:
             Sink name or None if not found
         """
-        # First try "get-default-sink" command (newer PulseAudio versions)
-        return_code, stdout, stderr = run_command(["pactl", "get-default-sink"])
+        if VolumeCommand._cached_sink:
+            return VolumeCommand._cached_sink
         
-        if return_code == 0 and stdout.strip():
-            return stdout.strip()
+        # First try "get-default-sink" command (newer PulseAudio versions)
+        if VolumeCommand._has_get_default_sink is not False:
+            return_code, stdout, stderr = run_command(["pactl", "get-default-sink"])
+            
+            if return_code == 0 and stdout.strip():
+                VolumeCommand._has_get_default_sink = True
+                VolumeCommand._cached_sink = stdout.strip()
+                return VolumeCommand._cached_sink
+            
+            VolumeCommand._has_get_default_sink = False
         
         # Fallback to "info" command for older versions
         return_code, stdout, stderr = run_command(["pactl", "info"])
@@ -209,11 +345,12 @@ class VolumeCommand(BaseCommand):
         if return_code == 0 and stdout:
             for line in stdout.splitlines():
                 if "Default Sink:" in line:
-                    return line.split(":", 1)[1].strip()
+                    VolumeCommand._cached_sink = line.split(":", 1)[1].strip()
+                    return VolumeCommand._cached_sink
         
         return None
     
-    def _get_pulseaudio_volume(self, sink: str) -> Tuple[int, bool]:
+    def _get_pulseaudio_volume(self, sink: str) -> Tuple[Optional[int], Optional[bool]]:
         """
         Get current PulseAudio volume and mute state.
 
@@ -221,22 +358,33 @@ class VolumeCommand(BaseCommand):
             sink: Sink name
 
         Returns:
-            Tuple of (volume percentage, is muted)
+            Tuple of (volume percentage, is muted), each None if it could not be read
         """
-        return_code, stdout, stderr = run_command(["pactl", "get-sink-volume", sink])
-        
-        volume = 0
-        if return_code == 0 and stdout:
-            # Parse volume from output
-            volume_match = re.search(r"(\d+)%", stdout)
-            if volume_match:
-                volume = int(volume_match.group(1))
+        # Read volume and mute state for all sinks in one call. The field
+        # labels are translated, so force the C locale to parse them.
+        return_code, stdout, stderr = run_command(
+            ["pactl", "list", "sinks"],
+            env={**os.environ, "LC_ALL": "C"},
+        )
         
-        return_code, stdout, stderr = run_command(["pactl", "get-sink-mute", sink])
+        volume = None
+        muted = None
+        if return_code != 0 or not stdout:
+            return volume, muted
         
-        muted = False
-        if return_code == 0 and stdout:
-            muted = "yes" in stdout.lower()
+        in_sink = False
+        for line in stdout.splitlines():
+            line = line.strip()
+            if line.startswith("Sink #"):
+                # Stop once we've moved past the requested sink's block
+                if in_sink:
+                    break
+            elif line.startswith("Name:"):
+                in_sink = line[len("Name:"):].strip() == sink
+            elif in_sink and line.startswith("Mute:"):
+                muted = "yes" in line.lower()
+            elif in_sink and line.startswith("Volume:"):
+                volume = _first_percent_int(line)
         
         return volume, muted
     
@@ -286,11 +434,11 @@ class VolumeCommand(BaseCommand):
         
         if action == "get" or stdout:
             # Parse volume and mute state from amixer output
-            volume_match = re.search(r"(\d+)%", stdout)
-            muted_match = re.search(r"\[(on|off)\]", stdout)
+            volume = _first_percent_int(stdout)
             
-            volume = volume_match.group(1) if volume_match else "unknown"
-            muted = "yes" if muted_match and muted_match.group(1) == "off" else "no"
+            if volume is None:
+                volume = "unknown"
+            muted = "yes" if "[off]" in stdout else "no"
             
             print(f"Current volume: {volume}%")
             print(f"Muted: {muted}")
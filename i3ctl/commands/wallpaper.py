@@ -3,15 +3,132 @@ Wallpaper management commands.
 """
 
 import argparse
+import json
 import os
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from i3ctl.commands.base import BaseCommand
 from i3ctl.commands import register_command
 from i3ctl.utils.logger import logger
-from i3ctl.utils.config import get_config_value, load_config, save_config
-from i3ctl.utils.system import run_command, check_command_exists
+from i3ctl.utils.config import CACHE_DIR, load_config, save_config
+from i3ctl.utils.system import run_command, has_command
+
+
+# Image files found under the last random wallpaper directory
+WALLPAPER_CACHE_FILE = os.path.join(CACHE_DIR, "wallpapers.json")
+
+# Number of wallpapers kept in the history
+WALLPAPER_HISTORY_SIZE = 10
+
+# Threads used to scan subdirectories of the wallpaper directory
+WALLPAPER_SCAN_WORKERS = 8
+
+# Directories skipped when scanning for wallpapers, along with hidden ones,
+# unless wallpaper_scan_hidden is enabled
+SKIPPED_SCAN_DIRS = frozenset({"node_modules", "__pycache__"})
+
+# File extensions recognised as images, without the leading dot
+IMAGE_EXTENSIONS = frozenset({
+    "jpg", "jpeg", "png", "gif", "bmp",
+    "tiff", "webp", "svg",
+})
+
+
+def _file_extension(name: str) -> str:
+    """
+    Get the lowercase extension of a file name without going through os.path.splitext.
+
+    Args:
+        name: File name, without any directory part
+
+    Returns:
+        Extension without the leading dot, or "" if there is none
+    """
+    # Like splitext, a leading dot marks a hidden file rather than an extension
+    idx = name.rfind(".")
+    return name[idx + 1:].lower() if idx > 0 else ""
+
+
+# Scaling modes mapped to feh options
+FEH_MODES = {
+    "fill": "--bg-fill",
+    "center": "--bg-center",
+    "tile": "--bg-tile",
+    "scale": "--bg-scale",
+    "max": "--bg-max",
+}
+
+# Scaling modes mapped to nitrogen options
+NITROGEN_MODES = {
+    "fill": "--set-zoom-fill",
+    "center": "--set-centered",
+    "tile": "--set-tiled",
+    "scale": "--set-scaled",
+    "max": "--set-zoomed",
+}
+
+# Magic bytes of supported image formats, as (offset, bytes) pairs that must all match
+IMAGE_SIGNATURES = (
+    ((0, b"\xff\xd8\xff"),),  # JPEG
+    ((0, b"\x89PNG\r\n\x1a\n"),),  # PNG
+    ((0, b"GIF8"),),  # GIF
+    ((0, b"BM"),),  # BMP
+    ((0, b"II*\x00"),),  # TIFF (little-endian)
+    ((0, b"MM\x00*"),),  # TIFF (big-endian)
+    ((0, b"RIFF"), (8, b"WEBP")),  # WebP
+)
+
+# Bytes needed to check every signature above
+IMAGE_SIGNATURE_SIZE = 12
+
+
+def _has_image_signature(path: str) -> bool:
+    """
+    Check whether a file starts with the magic bytes of a supported image format.
+
+    Args:
+        path: Path to file
+
+    Returns:
+        True if the file content looks like an image, False otherwise
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(IMAGE_SIGNATURE_SIZE)
+    except OSError:
+        return False
+    
+    return any(
+        all(head.startswith(magic, offset) for offset, magic in signature)
+        for signature in IMAGE_SIGNATURES
+    )
+
+
+def _positive_int(value: str) -> int:
+    """
+    Parse a command line value that must be a positive integer.
+
+    Args:
+        value: Value given on the command line
+
+    Returns:
+        Parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {number}")
+    
+    return number
 
 
 @register_command
@@ -28,6 +145,9 @@ class WallpaperCommand(BaseCommand):
         Initialize command.
         """
         super().__init__()
+        self._config = {}
+        self._config_dirty = False
+        self._exec_replace = False
         self._wallpaper_handlers = {
             "feh": self._use_feh,
             "nitrogen": self._use_nitrogen,
@@ -86,6 +206,14 @@ class WallpaperCommand(BaseCommand):
             default="fill",
             help="Wallpaper scaling mode (default: fill)"
         )
+        
+        # Bound the random wallpaper scan
+        self.parser.add_argument(
+            "--sample-cap",
+            type=_positive_int,
+            metavar="N",
+            help="With --random, stop scanning after N images and pick among those"
+        )
 
     def handle(self, args: argparse.Namespace) -> int:
         """
@@ -97,8 +225,12 @@ class WallpaperCommand(BaseCommand):
         Returns:
             Exit code
         """
+        # Load the config once and share it for the rest of the command
+        self._config = load_config()
+        self._config_dirty = False
+        
         # Get wallpaper tool from args, config, or auto-detect
-        tool = args.tool or get_config_value("wallpaper_tool", "auto")
+        tool = args.tool or self._config.get("wallpaper_tool", "auto")
         
         if tool == "auto":
             tool = self._detect_wallpaper_tool()
@@ -117,19 +249,32 @@ class WallpaperCommand(BaseCommand):
         # Call appropriate handler for the tool
         handler = self._wallpaper_handlers[tool]
         
+        # Restoring sets a wallpaper already in history, so nothing is left to
+        # record afterwards and, when run from the command line, the tool can
+        # replace this process instead of running as a child
+        self._exec_replace = (
+            getattr(args, "allow_exec", False)
+            and not args.list
+            and args.restore
+        )
+        
         if args.list:
             self._list_wallpapers()
         elif args.restore:
             self._restore_wallpaper(handler, args.mode)
         elif args.random:
-            path = args.path or get_config_value("wallpaper_directory", os.path.expanduser("~/Pictures"))
-            self._set_random_wallpaper(handler, path, args.mode)
+            path = args.path or self._config.get("wallpaper_directory", os.path.expanduser("~/Pictures"))
+            self._set_random_wallpaper(handler, path, args.mode, args.sample_cap)
         elif args.path:
             self._set_wallpaper(handler, args.path, args.mode)
         else:
             # No action specified, show help
             self.parser.print_help()
         
+        # Write back any changes made while handling the command
+        if self._config_dirty:
+            save_config(self._config)
+        
         return 0
     
     def _detect_wallpaper_tool(self) -> Optional[str]:
@@ -140,14 +285,14 @@ class WallpaperCommand(BaseCommand):
             Name of detected tool or None if no tool is found
         """
         for tool in self._wallpaper_handlers.keys():
-            if check_command_exists(tool):
+            if has_command(tool):
                 logger.info(f"Detected wallpaper tool: {tool}")
                 return tool
         
         logger.error("No wallpaper tool found")
         return None
     
-    def _set_wallpaper(self, handler: callable, path: str, mode: str) -> None:
+    def _set_wallpaper(self, handler: callable, path: str, mode: str, validated: bool = False) -> None:
         """
         Set wallpaper using the given handler.
 
@@ -155,27 +300,31 @@ class WallpaperCommand(BaseCommand):
             handler: Wallpaper handler function
             path: Path to wallpaper image
             mode: Scaling mode
+            validated: Whether path came from the image scan, and so is known to be
+                an absolute path with an image extension
         """
-        # Expand path if needed
-        path = os.path.expanduser(path)
-        path = os.path.abspath(path)
+        # Normalise the path. Absolute paths only need "." and ".." collapsed,
+        # which skips expanduser and the getcwd() call in abspath.
+        if not validated:
+            if path.startswith("/"):
+                path = os.path.normpath(path)
+            else:
+                path = os.path.abspath(os.path.expanduser(path))
         
         if not os.path.exists(path):
             logger.error(f"Wallpaper file not found: {path}")
             print(f"Error: Wallpaper file not found: {path}")
             return
         
-        # Check if file is an image
-        if not self._is_image_file(path):
+        # Check if file is an image, by extension or else by its content
+        if not validated and not self._is_image_file(path) and not _has_image_signature(path):
             logger.error(f"File is not a recognized image format: {path}")
             print(f"Error: File is not a recognized image format: {path}")
             return
         
-        # Set wallpaper
-        handler(path, mode)
-        
-        # Save to history
-        self._save_wallpaper_history(path)
+        # Set wallpaper, and save it to history once it is set
+        if handler(path, mode):
+            self._save_wallpaper_history(path)
     
     def _restore_wallpaper(self, handler: callable, mode: str) -> None:
         """
@@ -186,8 +335,7 @@ class WallpaperCommand(BaseCommand):
             mode: Scaling mode
         """
         # Get last wallpaper from history
-        config = load_config()
-        history = config.get("wallpaper_history", [])
+        history = self._config.get("wallpaper_history", [])
         
         if not history:
             logger.warning("No wallpaper history found")
@@ -211,19 +359,28 @@ class WallpaperCommand(BaseCommand):
         """
         List saved wallpaper history.
         """
-        config = load_config()
-        history = config.get("wallpaper_history", [])
+        history = self._config.get("wallpaper_history", [])
         
         if not history:
             print("No wallpaper history found.")
             return
         
+        # List each parent directory once instead of stat'ing every wallpaper
+        present = defaultdict(set)
+        for parent in {os.path.dirname(path) for path in history}:
+            try:
+                with os.scandir(parent or ".") as it:
+                    present[parent] = {entry.name for entry in it}
+            except OSError:
+                pass
+        
         print("Wallpaper History:")
         for i, path in enumerate(history):
-            exists = "✅" if os.path.exists(path) else "❌"
+            parent, name = os.path.split(path)
+            exists = "✅" if name in present[parent] else "❌"
             print(f"{i+1}. {exists} {path}")
     
-    def _set_random_wallpaper(self, handler: callable, directory: str, mode: str) -> None:
+    def _set_random_wallpaper(self, handler: callable, directory: str, mode: str, sample_cap: Optional[int] = None) -> None:
         """
         Set a random wallpaper from the given directory.
 
@@ -231,6 +388,7 @@ class WallpaperCommand(BaseCommand):
             handler: Wallpaper handler function
             directory: Directory containing wallpapers
             mode: Scaling mode
+            sample_cap: If given, stop scanning after this many images
         """
         directory = os.path.expanduser(directory)
         
@@ -239,27 +397,156 @@ class WallpaperCommand(BaseCommand):
             print(f"Error: Directory not found: {directory}")
             return
         
-        # Find all image files in directory
-        image_files = []
-        for root, _, files in os.walk(directory):
-            for file in files:
-                if self._is_image_file(file):
-                    image_files.append(os.path.join(root, file))
+        import random
+        if sample_cap is not None:
+            # Choose a random image while scanning, stopping after sample_cap
+            # images (reservoir sampling: the n-th image replaces the pick with
+            # probability 1/n, so the pick is uniform over the images visited)
+            random_image = None
+            count = 0
+            for path in self._iter_image_files(os.path.abspath(directory)):
+                count += 1
+                if random.randrange(count) == 0:
+                    random_image = path
+                if count >= sample_cap:
+                    break
+        else:
+            # Find all image files in directory
+            image_files = self._get_image_files(directory)
+            
+            # Choose random image
+            random_image = random.choice(image_files) if image_files else None
         
-        if not image_files:
+        if random_image is None:
             logger.error(f"No image files found in {directory}")
             print(f"Error: No image files found in {directory}")
             return
         
-        # Choose random image
-        import random
-        random_image = random.choice(image_files)
-        
         logger.info(f"Selected random wallpaper: {random_image}")
         print(f"Selected random wallpaper: {random_image}")
         
         # Set wallpaper
-        self._set_wallpaper(handler, random_image, mode)
+        self._set_wallpaper(handler, random_image, mode, validated=True)
+    
+    def _get_image_files(self, directory: str) -> List[str]:
+        """
+        Get image files in a directory, reusing the cached list if no directory has changed.
+
+        Adding, removing or renaming a file updates its parent directory's mtime,
+        so checking the mtime of every scanned directory is enough to validate the
+        cache without listing any of them.
+
+        Args:
+            directory: Directory containing wallpapers
+
+        Returns:
+            Paths of image files
+        """
+        directory = os.path.abspath(directory)
+        
+        try:
+            with open(WALLPAPER_CACHE_FILE, "r") as f:
+                cache = json.load(f)
+            if cache["directory"] == directory and cache["scan_hidden"] == self._scan_hidden() and all(
+                os.stat(path).st_mtime_ns == mtime for path, mtime in cache["dir_mtimes"].items()
+            ):
+                return cache["files"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+        
+        # Scan the top level here and its subdirectories concurrently, since on
+        # network or spinning storage each readdir mostly waits on I/O
+        dir_mtimes = {}
+        subdirs = []
+        image_files = list(self._iter_image_files(directory, dir_mtimes, subdirs))
+        
+        if subdirs:
+            with ThreadPoolExecutor(max_workers=WALLPAPER_SCAN_WORKERS) as executor:
+                for files, mtimes in executor.map(self._collect_image_files, subdirs):
+                    image_files.extend(files)
+                    dir_mtimes.update(mtimes)
+        
+        # Write the cache atomically so concurrent readers never see a partial file
+        tmp_path = f"{WALLPAPER_CACHE_FILE}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({
+                    "directory": directory,
+                    "scan_hidden": self._scan_hidden(),
+                    "dir_mtimes": dir_mtimes,
+                    "files": image_files,
+                }, f)
+            os.replace(tmp_path, WALLPAPER_CACHE_FILE)
+        except OSError as e:
+            logger.warning(f"Failed to write wallpaper cache: {e}")
+        
+        return image_files
+    
+    def _scan_hidden(self) -> bool:
+        """
+        Check whether hidden and tooling directories should be scanned for wallpapers.
+
+        Returns:
+            True if the wallpaper_scan_hidden config option is enabled
+        """
+        return bool(self._config.get("wallpaper_scan_hidden", False))
+    
+    def _collect_image_files(self, directory: str) -> Tuple[List[str], Dict[str, int]]:
+        """
+        Recursively find image files in a directory.
+
+        Args:
+            directory: Directory to search
+
+        Returns:
+            Tuple of (paths of image files, mtime of every directory scanned)
+        """
+        dir_mtimes = {}
+        image_files = list(self._iter_image_files(directory, dir_mtimes))
+        return image_files, dir_mtimes
+    
+    def _iter_image_files(
+        self,
+        directory: str,
+        dir_mtimes: Optional[Dict[str, int]] = None,
+        subdirs: Optional[List[str]] = None,
+    ) -> Iterator[str]:
+        """
+        Recursively find image files in a directory.
+
+        Args:
+            directory: Directory to search
+            dir_mtimes: If given, filled with the mtime of every directory scanned
+            subdirs: If given, subdirectories are appended here instead of being searched
+
+        Yields:
+            Paths of image files
+        """
+        scan_hidden = self._scan_hidden()
+        
+        try:
+            if dir_mtimes is not None:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+            
+            with os.scandir(directory) as it:
+                for entry in it:
+                    # DirEntry type checks use the d_type from readdir and only
+                    # stat symlinks, which are followed to files but not to directories
+                    if entry.is_dir(follow_symlinks=False):
+                        # Hidden and tooling directories hold many files but no wallpapers
+                        if not scan_hidden and (entry.name.startswith(".") or entry.name in SKIPPED_SCAN_DIRS):
+                            continue
+                        
+                        if subdirs is not None:
+                            subdirs.append(entry.path)
+                        else:
+                            yield from self._iter_image_files(entry.path, dir_mtimes)
+                    elif _file_extension(entry.name) in IMAGE_EXTENSIONS and entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            # Skip unreadable directories, as os.walk did
+            logger.debug(f"Cannot scan {directory}: {e}")
     
     def _save_wallpaper_history(self, path: str) -> None:
         """
@@ -268,24 +555,23 @@ class WallpaperCommand(BaseCommand):
         Args:
             path: Path to wallpaper
         """
-        config = load_config()
-        
-        # Get current history or create new one
-        history = config.get("wallpaper_history", [])
+        # Get current history or create new one, most recent first. Adding to
+        # the front of a full deque drops the oldest wallpaper from the back.
+        history = deque(
+            self._config.get("wallpaper_history", [])[:WALLPAPER_HISTORY_SIZE],
+            maxlen=WALLPAPER_HISTORY_SIZE,
+        )
         
         # Remove path if already in history
         if path in history:
             history.remove(path)
         
         # Add to front of history
-        history.insert(0, path)
-        
-        # Keep only the last 10 wallpapers
-        history = history[:10]
+        history.appendleft(path)
         
-        # Save updated history
-        config["wallpaper_history"] = history
-        save_config(config)
+        # Save updated history when the command finishes
+        self._config["wallpaper_history"] = list(history)
+        self._config_dirty = True
     
     def _is_image_file(self, path: str) -> bool:
         """
@@ -297,32 +583,21 @@ class WallpaperCommand(BaseCommand):
         Returns:
             True if file is an image, False otherwise
         """
-        image_extensions = [
-            ".jpg", ".jpeg", ".png", ".gif", ".bmp", 
-            ".tiff", ".webp", ".svg"
-        ]
-        
-        extension = os.path.splitext(path)[1].lower()
-        return extension in image_extensions
+        return _file_extension(os.path.basename(path)) in IMAGE_EXTENSIONS
     
-    def _use_feh(self, path: str, mode: str) -> None:
+    def _use_feh(self, path: str, mode: str) -> bool:
         """
         Set wallpaper using feh.
 
         Args:
             path: Path to wallpaper image
             mode: Scaling mode
+            
+        Returns:
+            True if the wallpaper was set
         """
         # Map mode to feh options
-        mode_mapping = {
-            "fill": "--bg-fill",
-            "center": "--bg-center",
-            "tile": "--bg-tile",
-            "scale": "--bg-scale",
-            "max": "--bg-max",
-        }
-        
-        feh_mode = mode_mapping.get(mode, "--bg-fill")
+        feh_mode = FEH_MODES.get(mode, "--bg-fill")
         
         cmd = ["feh", feh_mode, path]
         msg = f"Setting wallpaper with feh: {path}"
@@ -330,49 +605,66 @@ class WallpaperCommand(BaseCommand):
         logger.info(msg)
         print(msg)
         
-        return_code, stdout, stderr = run_command(cmd)
-        
-        if return_code != 0:
-            logger.error(f"feh command failed: {stderr}")
-            print(f"Error: {stderr}")
-            return
-        
-        print("Wallpaper set successfully.")
+        return self._run_wallpaper_tool(cmd)
     
-    def _use_nitrogen(self, path: str, mode: str) -> None:
+    def _use_nitrogen(self, path: str, mode: str) -> bool:
         """
         Set wallpaper using nitrogen.
 
         Args:
             path: Path to wallpaper image
             mode: Scaling mode
+            
+        Returns:
+            True if the wallpaper was set
         """
         # Map mode to nitrogen options
-        mode_mapping = {
-            "fill": "zoom-fill",
-            "center": "centered",
-            "tile": "tiled",
-            "scale": "scaled",
-            "max": "zoomed",
-        }
-        
-        nitrogen_mode = mode_mapping.get(mode, "zoom-fill")
+        nitrogen_mode = NITROGEN_MODES.get(mode, "--set-zoom-fill")
         
-        cmd = ["nitrogen", "--set-zoom-fill", "--save", path]
+        cmd = ["nitrogen", nitrogen_mode, "--save", path]
         msg = f"Setting wallpaper with nitrogen: {path}"
         
-        # If not zoom-fill, use the appropriate mode
-        if nitrogen_mode != "zoom-fill":
-            cmd = ["nitrogen", f"--set-{nitrogen_mode}", "--save", path]
-        
         logger.info(msg)
         print(msg)
         
+        return self._run_wallpaper_tool(cmd)
+    
+    def _run_wallpaper_tool(self, cmd: List[str]) -> bool:
+        """
+        Run a wallpaper tool command.
+
+        When nothing is left to do afterwards, the tool replaces this process
+        via exec instead of being forked and waited on. Its own output and
+        exit status then become the command's.
+
+        Args:
+            cmd: Command to run as a list of strings
+            
+        Returns:
+            True if the command succeeded
+        """
+        if self._exec_replace:
+            # Nothing after exec runs, so persist and flush everything first
+            if self._config_dirty:
+                save_config(self._config)
+                self._config_dirty = False
+            
+            sys.stdout.flush()
+            sys.stderr.flush()
+            for log_handler in logger.handlers:
+                log_handler.flush()
+            
+            try:
+                os.execvp(cmd[0], cmd)
+            except OSError as e:
+                logger.debug(f"Cannot exec {cmd[0]}, running it as a subprocess: {e}")
+        
         return_code, stdout, stderr = run_command(cmd)
         
         if return_code != 0:
-            logger.error(f"nitrogen command failed: {stderr}")
+            logger.error(f"{cmd[0]} command failed: {stderr}")
             print(f"Error: {stderr}")
-            return
+            return False
         
-        print("Wallpaper set successfully.")
\ No newline at end of file
+        print("Wallpaper set successfully.")
+        return True
@@ -3,18 +3,90 @@ Workspace management commands for i3.
 """
 
 import argparse
-import json
+import functools
 import os
 import re
-import subprocess
-from typing import Dict, List, Optional, Tuple, Any
+import shutil
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from i3ctl.commands.base import BaseCommand
 from i3ctl.commands import register_command
-from i3ctl.commands.i3_wrapper import I3Wrapper, i3ipc_connection
 from i3ctl.utils.logger import logger
-from i3ctl.utils.system import run_command, check_command_exists
-from i3ctl.utils.config import load_config, save_config
+from i3ctl.utils.system import run_command, has_command
+from i3ctl.utils.config import CONFIG_DIR, load_config, save_config
+
+
+LAYOUTS_DIR = os.path.join(CONFIG_DIR, "layouts")
+
+# Workspace state flags shown by "workspace list", in display order
+WORKSPACE_FLAGS = ("focused", "visible", "urgent")
+
+# Whole-line // comments in i3-save-tree output, which is otherwise JSON
+LAYOUT_COMMENT_RE = re.compile(r"(?m)^[ \t]*//[^\n]*\n?")
+
+
+def _ws_target(name: str) -> str:
+    """
+    Format a workspace reference for an i3 command.
+    
+    Args:
+        name: Workspace name or number
+        
+    Returns:
+        "number N" for purely numeric names, otherwise the name itself
+    """
+    return f"number {name}" if name.isdigit() else name
+
+
+def _requires_i3(method: Callable[..., int]) -> Callable[..., int]:
+    """
+    Make a subcommand handler fail early when i3 is not available.
+    
+    Args:
+        method: Handler that talks to i3
+        
+    Returns:
+        Wrapped handler
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs) -> int:
+        # Deferred so building the parser doesn't load i3ipc
+        from i3ctl.commands.i3_wrapper import I3Wrapper
+        
+        # Check if i3 is available
+        try:
+            I3Wrapper.ensure_i3()
+        except Exception as e:
+            logger.error(f"i3 not found: {e}")
+            print(f"Error: i3 not found. {e}")
+            return 1
+        
+        return method(self, *args, **kwargs)
+    
+    return wrapper
+
+
+@functools.lru_cache(maxsize=None)
+def _find_i3_config() -> Optional[str]:
+    """
+    Find i3 config file, caching the result for this process.
+    
+    Returns:
+        Path to i3 config file or None if not found
+    """
+    # Common i3 config locations, $XDG_CONFIG_HOME first as i3 itself does
+    config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    locations = [
+        os.path.join(config_home, "i3", "config"),
+        os.path.expanduser("~/.i3/config"),
+        "/etc/i3/config"
+    ]
+    
+    for location in locations:
+        if os.path.isfile(location):
+            return location
+    
+    return None
 
 
 @register_command
@@ -26,6 +98,75 @@ class WorkspaceCommand(BaseCommand):
     name = "workspace"
     help = "Manage i3 workspaces"
 
+    # Subcommand name -> (help, [(argument flags, add_argument options), ...])
+    _SUBCOMMANDS = {
+        "list": ("List all workspaces", []),
+        "create": ("Create a new workspace", [
+            (("name",), {"help": "Name of the workspace to create"}),
+        ]),
+        "rename": ("Rename current or specified workspace", [
+            (("new_name",), {"help": "New name for the workspace"}),
+            (("--number", "-n"), {
+                "help": "Number of the workspace to rename (current if not specified)",
+            }),
+        ]),
+        "goto": ("Go to a workspace", [
+            (("name",), {"help": "Name or number of the workspace to go to"}),
+        ]),
+        "move": ("Move current container to a workspace", [
+            (("target",), {"help": "Target workspace name or number"}),
+        ]),
+        "output": ("Move workspace to a specific output", [
+            (("workspace",), {"help": "Workspace name or number"}),
+            (("output",), {"help": "Output name (e.g., HDMI-1, DP-1)"}),
+        ]),
+        "assign": ("Assign application to workspace", [
+            (("criteria",), {"help": "Window criteria (e.g., 'class=Firefox')"}),
+            (("workspace",), {"help": "Target workspace name or number"}),
+            (("--add", "-a"), {
+                "action": "store_true",
+                "help": "Add to i3 config (otherwise it's temporary for this session)",
+            }),
+        ]),
+        "save": ("Save current workspace layout", [
+            (("name",), {"help": "Name to save this layout as"}),
+            (("--workspace", "-w"), {
+                "help": "Workspace to save (current if not specified)",
+            }),
+        ]),
+        "load": ("Load a saved workspace layout", [
+            (("name",), {"help": "Name of the saved layout"}),
+            (("--workspace", "-w"), {
+                "help": "Target workspace (current if not specified)",
+            }),
+        ]),
+        "layouts": ("List saved workspace layouts", []),
+        "delete": ("Delete a saved workspace layout", [
+            (("name",), {"help": "Name of the layout to delete"}),
+        ]),
+    }
+
+    def __init__(self) -> None:
+        """
+        Initialize command.
+        """
+        super().__init__()
+        # i3ctl config, read from disk at most once per instance
+        self._config_cache: Optional[Dict[str, Any]] = None
+        self._dispatch = {
+            "list": lambda a: self._list_workspaces(),
+            "create": lambda a: self._create_workspace(a.name),
+            "rename": lambda a: self._rename_workspace(a.new_name, a.number),
+            "goto": lambda a: self._goto_workspace(a.name),
+            "move": lambda a: self._move_to_workspace(a.target),
+            "output": lambda a: self._workspace_to_output(a.workspace, a.output),
+            "assign": lambda a: self._assign_to_workspace(a.criteria, a.workspace, a.add),
+            "save": lambda a: self._save_layout(a.name, a.workspace),
+            "load": lambda a: self._load_layout(a.name, a.workspace),
+            "layouts": lambda a: self._list_layouts(),
+            "delete": lambda a: self._delete_layout(a.name),
+        }
+
     def _setup_arguments(self, parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
         """
         Set up command arguments.
@@ -39,69 +180,16 @@ class WorkspaceCommand(BaseCommand):
         self.parser = parser  # Save the parser for later use
         subparsers = parser.add_subparsers(dest="subcommand")
         
-        # List workspaces
-        list_parser = subparsers.add_parser("list", help="List all workspaces")
-        
-        # Create workspace
-        create_parser = subparsers.add_parser("create", help="Create a new workspace")
-        create_parser.add_argument("name", help="Name of the workspace to create")
-        
-        # Rename workspace
-        rename_parser = subparsers.add_parser("rename", help="Rename current or specified workspace")
-        rename_parser.add_argument("new_name", help="New name for the workspace")
-        rename_parser.add_argument(
-            "--number", "-n", 
-            help="Number of the workspace to rename (current if not specified)"
-        )
-        
-        # Go to workspace
-        goto_parser = subparsers.add_parser("goto", help="Go to a workspace")
-        goto_parser.add_argument("name", help="Name or number of the workspace to go to")
-        
-        # Move container to workspace
-        move_parser = subparsers.add_parser("move", help="Move current container to a workspace")
-        move_parser.add_argument("target", help="Target workspace name or number")
-        
-        # Show workspace on specific output
-        output_parser = subparsers.add_parser("output", help="Move workspace to a specific output")
-        output_parser.add_argument("workspace", help="Workspace name or number")
-        output_parser.add_argument("output", help="Output name (e.g., HDMI-1, DP-1)")
-        
-        # Assign application to workspace
-        assign_parser = subparsers.add_parser("assign", help="Assign application to workspace")
-        assign_parser.add_argument("criteria", help="Window criteria (e.g., 'class=Firefox')")
-        assign_parser.add_argument("workspace", help="Target workspace name or number")
-        assign_parser.add_argument(
-            "--add", "-a",
-            action="store_true",
-            help="Add to i3 config (otherwise it's temporary for this session)"
-        )
-        
-        # Save workspace layout
-        save_parser = subparsers.add_parser("save", help="Save current workspace layout")
-        save_parser.add_argument(
-            "name",
-            help="Name to save this layout as"
-        )
-        save_parser.add_argument(
-            "--workspace", "-w",
-            help="Workspace to save (current if not specified)"
-        )
-        
-        # Load workspace layout
-        load_parser = subparsers.add_parser("load", help="Load a saved workspace layout")
-        load_parser.add_argument("name", help="Name of the saved layout")
-        load_parser.add_argument(
-            "--workspace", "-w",
-            help="Target workspace (current if not specified)"
-        )
-        
-        # List saved layouts
-        layouts_parser = subparsers.add_parser("layouts", help="List saved workspace layouts")
-        
-        # Delete saved layout
-        delete_parser = subparsers.add_parser("delete", help="Delete a saved workspace layout")
-        delete_parser.add_argument("name", help="Name of the layout to delete")
+        # Only build the requested subcommand; build all of them for help/usage
+        requested = self._requested_subcommand(self._SUBCOMMANDS)
+        
+        for name, (help_text, arguments) in self._SUBCOMMANDS.items():
+            if requested and name != requested:
+                continue
+            
+            subparser = subparsers.add_parser(name, help=help_text)
+            for flags, options in arguments:
+                subparser.add_argument(*flags, **options)
         
         return parser
 
@@ -119,46 +207,101 @@ class WorkspaceCommand(BaseCommand):
             self.parser.print_help()
             return 0
         
-        # Check if i3 is available
-        try:
-            I3Wrapper.ensure_i3()
-        except Exception as e:
-            logger.error(f"i3 not found: {e}")
-            print(f"Error: i3 not found. {e}")
-            return 1
-        
         try:
             # Handle subcommands
-            if args.subcommand == "list":
-                return self._list_workspaces()
-            elif args.subcommand == "create":
-                return self._create_workspace(args.name)
-            elif args.subcommand == "rename":
-                return self._rename_workspace(args.new_name, args.number)
-            elif args.subcommand == "goto":
-                return self._goto_workspace(args.name)
-            elif args.subcommand == "move":
-                return self._move_to_workspace(args.target)
-            elif args.subcommand == "output":
-                return self._workspace_to_output(args.workspace, args.output)
-            elif args.subcommand == "assign":
-                return self._assign_to_workspace(args.criteria, args.workspace, args.add)
-            elif args.subcommand == "save":
-                return self._save_layout(args.name, args.workspace)
-            elif args.subcommand == "load":
-                return self._load_layout(args.name, args.workspace)
-            elif args.subcommand == "layouts":
-                return self._list_layouts()
-            elif args.subcommand == "delete":
-                return self._delete_layout(args.name)
+            handler = self._dispatch.get(args.subcommand)
+            if handler is None:
+                return 0
             
-            return 0
+            return handler(args)
             
         except Exception as e:
             logger.error(f"Error executing workspace command: {e}")
             print(f"Error: {str(e)}")
             return 1
     
+    def _load_config(self) -> Dict[str, Any]:
+        """
+        Load the i3ctl config, reusing the copy read earlier if there is one.
+        
+        Returns:
+            Configuration dictionary
+        """
+        if self._config_cache is None:
+            self._config_cache = load_config()
+        return self._config_cache
+    
+    def _save_config(self, config: Dict[str, Any]) -> None:
+        """
+        Save the i3ctl config and keep it as the cached copy.
+        
+        Args:
+            config: Configuration dictionary to save
+        """
+        self._config_cache = config
+        save_config(config)
+    
+    def _with_i3(self, fn: Callable[[Any], Any]) -> Any:
+        """
+        Run a callable against a single i3 IPC connection.
+
+        Args:
+            fn: Callable taking the open connection
+
+        Returns:
+            Result of the callable, or None if i3 could not be reached
+        """
+        from i3ctl.commands.i3_wrapper import I3NotFoundError, i3ipc_connection
+        
+        try:
+            with i3ipc_connection() as i3:
+                return fn(i3)
+        except I3NotFoundError:
+            return None
+    
+    def _run_i3(self, command: str, i3: Optional[Any] = None) -> bool:
+        """
+        Run an i3 command over IPC instead of spawning i3-msg.
+
+        Args:
+            command: i3 command string
+            i3: Open connection to reuse (a new one is opened if None)
+
+        Returns:
+            True if every part of the command succeeded, False otherwise
+        """
+        if i3 is None:
+            replies = self._with_i3(lambda conn: conn.command(command))
+        else:
+            replies = i3.command(command)
+        
+        if not replies:
+            return False
+        
+        for reply in replies:
+            if not reply.success:
+                logger.error(f"i3 command failed: {command}: {reply.error}")
+        
+        return all(reply.success for reply in replies)
+    
+    def _focused_workspace_name(self, i3: Any) -> Optional[str]:
+        """
+        Get the name of the focused workspace.
+
+        Args:
+            i3: Open i3 connection
+
+        Returns:
+            Workspace name or None if no workspace is focused
+        """
+        # The workspace list is much smaller than the full tree
+        for workspace in i3.get_workspaces():
+            if workspace.focused:
+                return workspace.name
+        
+        return None
+    
+    @_requires_i3
     def _list_workspaces(self) -> int:
         """
         List all workspaces.
@@ -166,6 +309,8 @@ class WorkspaceCommand(BaseCommand):
         Returns:
             Exit code
         """
+        from i3ctl.commands.i3_wrapper import I3Wrapper
+        
         logger.info("Listing workspaces")
         
         try:
@@ -175,26 +320,18 @@ class WorkspaceCommand(BaseCommand):
                 print("No workspaces found.")
                 return 0
             
-            print("Current workspaces:")
+            # Collect the listing and print it in one write
+            lines = ["Current workspaces:"]
             for workspace in workspaces:
-                focused = workspace.get("focused", False)
-                visible = workspace.get("visible", False)
-                urgent = workspace.get("urgent", False)
                 name = workspace.get("name", "Unknown")
                 output = workspace.get("output", "Unknown")
                 
-                status = []
-                if focused:
-                    status.append("focused")
-                if visible:
-                    status.append("visible")
-                if urgent:
-                    status.append("urgent")
-                
-                status_str = f" ({', '.join(status)})" if status else ""
+                status = ", ".join(flag for flag in WORKSPACE_FLAGS if workspace.get(flag))
+                status_str = f" ({status})" if status else ""
                 
-                print(f"Workspace {name}{status_str} on output {output}")
+                lines.append(f"Workspace {name}{status_str} on output {output}")
             
+            print("\n".join(lines))
             return 0
             
         except Exception as e:
@@ -202,6 +339,7 @@ class WorkspaceCommand(BaseCommand):
             print(f"Error: Failed to list workspaces: {e}")
             return 1
     
+    @_requires_i3
     def _create_workspace(self, name: str) -> int:
         """
         Create a new workspace.
@@ -214,15 +352,9 @@ class WorkspaceCommand(BaseCommand):
         """
         logger.info(f"Creating workspace: {name}")
         
-        # If name is just a number, convert it to a string
-        if name.isdigit():
-            command = ["workspace", f"number {name}"]
-        else:
-            command = ["workspace", name]
-        
-        success, result = I3Wrapper.i3_command(command)
+        command = f"workspace {_ws_target(name)}"
         
-        if not success:
+        if not self._run_i3(command):
             logger.error(f"Failed to create workspace: {name}")
             print(f"Error: Failed to create workspace: {name}")
             return 1
@@ -230,6 +362,7 @@ class WorkspaceCommand(BaseCommand):
         print(f"Created and switched to workspace: {name}")
         return 0
     
+    @_requires_i3
     def _rename_workspace(self, new_name: str, workspace_num: Optional[str] = None) -> int:
         """
         Rename a workspace.
@@ -243,28 +376,21 @@ class WorkspaceCommand(BaseCommand):
         """
         logger.info(f"Renaming workspace to: {new_name}")
         
-        try:
-            # Get current workspace if number not provided
-            old_name = workspace_num
-            
+        def rename(i3: Any) -> Tuple[Optional[str], bool]:
+            # Resolve the workspace and rename it over the same connection
+            old_name = workspace_num or self._focused_workspace_name(i3)
             if not old_name:
-                # Use i3ipc to get focused workspace name
-                with i3ipc_connection() as i3:
-                    focused = i3.get_tree().find_focused()
-                    if focused:
-                        workspace = focused.workspace()
-                        if workspace:
-                            old_name = workspace.name
+                return None, False
+            return old_name, self._run_i3(f"rename workspace {old_name} to {new_name}", i3)
+        
+        try:
+            old_name, success = self._with_i3(rename) or (None, False)
             
             if not old_name:
                 logger.error("Failed to get current workspace name")
                 print("Error: Failed to get current workspace name")
                 return 1
             
-            # Rename workspace
-            command = ["rename", "workspace", old_name, "to", new_name]
-            success, result = I3Wrapper.i3_command(command)
-            
             if not success:
                 logger.error(f"Failed to rename workspace: {old_name} to {new_name}")
                 print(f"Error: Failed to rename workspace: {old_name} to {new_name}")
@@ -278,6 +404,7 @@ class WorkspaceCommand(BaseCommand):
             print(f"Error: Failed to rename workspace: {e}")
             return 1
     
+    @_requires_i3
     def _goto_workspace(self, name: str) -> int:
         """
         Go to a workspace.
@@ -290,15 +417,9 @@ class WorkspaceCommand(BaseCommand):
         """
         logger.info(f"Going to workspace: {name}")
         
-        # If name is just a number, convert it to a string
-        if name.isdigit():
-            command = ["workspace", f"number {name}"]
-        else:
-            command = ["workspace", name]
-        
-        success, result = I3Wrapper.i3_command(command)
+        command = f"workspace {_ws_target(name)}"
         
-        if not success:
+        if not self._run_i3(command):
             logger.error(f"Failed to go to workspace: {name}")
             print(f"Error: Failed to go to workspace: {name}")
             return 1
@@ -306,6 +427,7 @@ class WorkspaceCommand(BaseCommand):
         print(f"Switched to workspace: {name}")
         return 0
     
+    @_requires_i3
     def _move_to_workspace(self, target: str) -> int:
         """
         Move current container to a workspace.
@@ -318,15 +440,9 @@ class WorkspaceCommand(BaseCommand):
         """
         logger.info(f"Moving container to workspace: {target}")
         
-        # If target is just a number, convert it to a string
-        if target.isdigit():
-            command = ["move", "container", "to", "workspace", f"number {target}"]
-        else:
-            command = ["move", "container", "to", "workspace", target]
-        
-        success, result = I3Wrapper.i3_command(command)
+        command = f"move container to workspace {_ws_target(target)}"
         
-        if not success:
+        if not self._run_i3(command):
             logger.error(f"Failed to move container to workspace: {target}")
             print(f"Error: Failed to move container to workspace: {target}")
             return 1
@@ -334,6 +450,7 @@ class WorkspaceCommand(BaseCommand):
         print(f"Moved container to workspace: {target}")
         return 0
     
+    @_requires_i3
     def _workspace_to_output(self, workspace: str, output: str) -> int:
         """
         Move workspace to a specific output.
@@ -347,15 +464,9 @@ class WorkspaceCommand(BaseCommand):
         """
         logger.info(f"Moving workspace {workspace} to output {output}")
         
-        # If workspace is just a number, convert it to a string
-        if workspace.isdigit():
-            command = ["workspace", f"number {workspace}", "output", output]
-        else:
-            command = ["workspace", workspace, "output", output]
-        
-        success, result = I3Wrapper.i3_command(command)
+        command = f"workspace {_ws_target(workspace)} output {output}"
         
-        if not success:
+        if not self._run_i3(command):
             logger.error(f"Failed to move workspace {workspace} to output {output}")
             print(f"Error: Failed to move workspace {workspace} to output {output}")
             return 1
@@ -363,6 +474,7 @@ class WorkspaceCommand(BaseCommand):
         print(f"Moved workspace {workspace} to output {output}")
         return 0
     
+    @_requires_i3
     def _assign_to_workspace(self, criteria: str, workspace: str, add_to_config: bool = False) -> int:
         """
         Assign application to workspace.
@@ -379,7 +491,7 @@ class WorkspaceCommand(BaseCommand):
         
         if add_to_config:
             # Add to i3 config
-            i3_config_path = self._find_i3_config()
+            i3_config_path = _find_i3_config()
             
             if not i3_config_path:
                 logger.error("i3 config not found")
@@ -389,31 +501,37 @@ class WorkspaceCommand(BaseCommand):
             try:
                 # Read i3 config
                 with open(i3_config_path, "r") as f:
-                    content = f.readlines()
+                    content = f.read()
                 
                 # Format assign line
-                if workspace.isdigit():
-                    assign_line = f"assign [{criteria}] → number {workspace}\n"
-                else:
-                    assign_line = f"assign [{criteria}] → {workspace}\n"
+                assign_line = f"assign [{criteria}] → {_ws_target(workspace)}\n"
                 
-                # Look for last assign line or insert at end
-                assign_index = -1
-                for i, line in enumerate(content):
-                    if line.strip().startswith("assign "):
-                        assign_index = i
+                # Look for last assign line, searching backwards from the end
+                assign_index = content.rfind("assign ")
+                while assign_index != -1:
+                    line_start = content.rfind("\n", 0, assign_index) + 1
+                    if not content[line_start:assign_index].strip():
+                        break
+                    assign_index = content.rfind("assign ", 0, assign_index)
                 
                 if assign_index >= 0:
                     # Insert after last assign line
-                    content.insert(assign_index + 1, assign_line)
+                    line_end = content.find("\n", assign_index)
+                    if line_end == -1:
+                        content = f"{content}\n{assign_line}"
+                    else:
+                        content = content[:line_end + 1] + assign_line + content[line_end + 1:]
                 else:
                     # Insert at end
-                    content.append("\n# Window assignments\n")
-                    content.append(assign_line)
+                    content = f"{content}\n# Window assignments\n{assign_line}"
                 
-                # Write back to config
-                with open(i3_config_path, "w") as f:
-                    f.writelines(content)
+                # Write back to config atomically, keeping its permissions
+                config_path = os.path.realpath(i3_config_path)
+                tmp_path = f"{config_path}.tmp"
+                with open(tmp_path, "w") as f:
+                    f.write(content)
+                shutil.copymode(config_path, tmp_path)
+                os.replace(tmp_path, config_path)
                 
                 print(f"Added assignment to i3 config: {criteria} → {workspace}")
                 print("Reload i3 config to apply changes.")
@@ -424,14 +542,9 @@ class WorkspaceCommand(BaseCommand):
                 return 1
         else:
             # Apply for current session only
-            if workspace.isdigit():
-                command = ["assign", f"[{criteria}]", f"workspace number {workspace}"]
-            else:
-                command = ["assign", f"[{criteria}]", f"workspace {workspace}"]
+            command = f"assign [{criteria}] workspace {_ws_target(workspace)}"
             
-            success, result = I3Wrapper.i3_command(command)
-            
-            if not success:
+            if not self._run_i3(command):
                 logger.error(f"Failed to assign {criteria} to workspace {workspace}")
                 print(f"Error: Failed to assign {criteria} to workspace {workspace}")
                 return 1
@@ -440,6 +553,7 @@ class WorkspaceCommand(BaseCommand):
         
         return 0
     
+    @_requires_i3
     def _save_layout(self, name: str, workspace_num: Optional[str] = None) -> int:
         """
         Save workspace layout.
@@ -454,7 +568,7 @@ class WorkspaceCommand(BaseCommand):
         logger.info(f"Saving workspace layout as {name}")
         
         # Check if i3-save-tree is available
-        if not check_command_exists("i3-save-tree"):
+        if not has_command("i3-save-tree"):
             logger.error("i3-save-tree command not found")
             print("Error: i3-save-tree command not found.")
             print("Please install i3-save-tree to use this feature.")
@@ -463,13 +577,7 @@ class WorkspaceCommand(BaseCommand):
         try:
             # Get current workspace if number not provided
             if not workspace_num:
-                # Use i3ipc to get focused workspace name
-                with i3ipc_connection() as i3:
-                    focused = i3.get_tree().find_focused()
-                    if focused:
-                        workspace = focused.workspace()
-                        if workspace:
-                            workspace_num = workspace.name
+                workspace_num = self._with_i3(self._focused_workspace_name)
             
             if not workspace_num:
                 logger.error("Failed to get current workspace name")
@@ -477,11 +585,10 @@ class WorkspaceCommand(BaseCommand):
                 return 1
             
             # Create directories
-            layouts_dir = os.path.expanduser("~/.config/i3ctl/layouts")
-            os.makedirs(layouts_dir, exist_ok=True)
+            os.makedirs(LAYOUTS_DIR, exist_ok=True)
             
             # Save layout
-            layout_path = os.path.join(layouts_dir, f"{name}.json")
+            layout_path = os.path.join(LAYOUTS_DIR, f"{name}.json")
             
             # Run i3-save-tree to get layout
             cmd = ["i3-save-tree", f"--workspace={workspace_num}"]
@@ -492,27 +599,18 @@ class WorkspaceCommand(BaseCommand):
                 print(f"Error: Failed to save workspace layout: {stderr}")
                 return 1
             
-            # Process the layout (remove comments and fix JSON)
-            layout_json = ""
-            for line in stdout.splitlines():
-                if not line.strip().startswith("//"):
-                    layout_json += line + "\n"
-            
-            # Save to file
+            # Save to file, dropping the comment lines i3-save-tree emits
             with open(layout_path, "w") as f:
-                f.write(layout_json)
+                f.write(LAYOUT_COMMENT_RE.sub("", stdout))
             
             # Update workspace layout registry in config
-            config = load_config()
-            if "workspace_layouts" not in config:
-                config["workspace_layouts"] = {}
-            
-            config["workspace_layouts"][name] = {
+            config = self._load_config()
+            config.setdefault("workspace_layouts", {})[name] = {
                 "path": layout_path,
                 "workspace": workspace_num
             }
             
-            save_config(config)
+            self._save_config(config)
             
             print(f"Saved workspace {workspace_num} layout as '{name}'")
             return 0
@@ -522,6 +620,7 @@ class WorkspaceCommand(BaseCommand):
             print(f"Error: Failed to save workspace layout: {e}")
             return 1
     
+    @_requires_i3
     def _load_layout(self, name: str, workspace_num: Optional[str] = None) -> int:
         """
         Load workspace layout.
@@ -537,7 +636,7 @@ class WorkspaceCommand(BaseCommand):
         
         try:
             # Load layout registry
-            config = load_config()
+            config = self._load_config()
             layouts = config.get("workspace_layouts", {})
             
             if name not in layouts:
@@ -552,49 +651,30 @@ class WorkspaceCommand(BaseCommand):
                 print(f"Error: Layout file not found: {layout_path}")
                 return 1
             
-            # Get current workspace if not provided
-            if not workspace_num:
-                # Use i3ipc to get focused workspace name
-                with i3ipc_connection() as i3:
-                    focused = i3.get_tree().find_focused()
-                    if focused:
-                        workspace = focused.workspace()
-                        if workspace:
-                            workspace_num = workspace.name
+            def append(i3: Any) -> Tuple[Optional[str], bool]:
+                # Resolve the workspace and append the layout over the same connection
+                target = workspace_num or self._focused_workspace_name(i3)
+                if not target:
+                    return None, False
+                # Append layout (this requires a running program for each placeholder in the layout)
+                return target, self._run_i3(f'append_layout "{layout_path}"', i3)
+            
+            workspace_num, success = self._with_i3(append) or (None, False)
             
             if not workspace_num:
                 logger.error("Failed to get current workspace name")
                 print("Error: Failed to get current workspace name")
                 return 1
             
-            # Open and read layout file
-            with open(layout_path, "r") as f:
-                layout_content = f.read()
-            
-            # Create a temporary file to store the layout
-            temp_path = "/tmp/i3ctl_layout.json"
-            with open(temp_path, "w") as f:
-                f.write(layout_content)
-            
-            # Append layout (this requires a running program for each placeholder in the layout)
-            cmd = ["i3-msg", "append_layout", temp_path]
-            return_code, stdout, stderr = run_command(cmd)
-            
-            if return_code != 0:
-                logger.error(f"Failed to load layout: {stderr}")
-                print(f"Error: Failed to load layout: {stderr}")
+            if not success:
+                logger.error("Failed to load layout")
+                print("Error: Failed to load layout")
                 return 1
             
             print(f"Loaded layout '{name}' to workspace {workspace_num}")
             print("Note: You may need to start the applications specified in the layout.")
             print("Any '[placeholder]' entries in the layout need to be filled manually.")
             
-            # Clean up temporary file
-            try:
-                os.remove(temp_path)
-            except:
-                pass
-            
             return 0
             
         except Exception as e:
@@ -612,18 +692,29 @@ class WorkspaceCommand(BaseCommand):
         logger.info("Listing saved workspace layouts")
         
         # Load layout registry
-        config = load_config()
+        config = self._load_config()
         layouts = config.get("workspace_layouts", {})
         
         if not layouts:
             print("No saved workspace layouts found.")
             return 0
         
+        # Read the layouts directory once rather than checking each file
+        try:
+            with os.scandir(LAYOUTS_DIR) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+        
         print("Saved workspace layouts:")
         for name, layout_info in layouts.items():
             workspace = layout_info.get("workspace", "Unknown")
             path = layout_info.get("path", "Unknown")
-            exists = "✓" if os.path.exists(path) else "✗"
+            directory, filename = os.path.split(path)
+            if directory == LAYOUTS_DIR:
+                exists = "✓" if filename in existing else "✗"
+            else:
+                exists = "✓" if os.path.exists(path) else "✗"
             
             print(f"- {name}: Workspace {workspace} [{exists}]")
         
@@ -642,7 +733,7 @@ class WorkspaceCommand(BaseCommand):
         logger.info(f"Deleting workspace layout {name}")
         
         # Load layout registry
-        config = load_config()
+        config = self._load_config()
         layouts = config.get("workspace_layouts", {})
         
         if name not in layouts:
@@ -663,27 +754,7 @@ class WorkspaceCommand(BaseCommand):
         # Remove from registry
         del layouts[name]
         config["workspace_layouts"] = layouts
-        save_config(config)
+        self._save_config(config)
         
         print(f"Deleted workspace layout '{name}'")
         return 0
-    
-    def _find_i3_config(self) -> Optional[str]:
-        """
-        Find i3 config file.
-        
-        Returns:
-            Path to i3 config file or None if not found
-        """
-        # Common i3 config locations
-        locations = [
-            os.path.expanduser("~/.config/i3/config"),
-            os.path.expanduser("~/.i3/config"),
-            "/etc/i3/config"
-        ]
-        
-        for location in locations:
-            if os.path.isfile(location):
-                return location
-        
-        return None
\ No newline at end of file
@@ -5,13 +5,14 @@ Configuration handling for i3ctl.
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from i3ctl.utils.logger import logger
 
 # Configuration paths - made as variables for easier testing
 CONFIG_DIR = os.path.expanduser("~/.config/i3ctl")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+CACHE_DIR = os.path.expanduser("~/.cache/i3ctl")
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -20,10 +21,51 @@ DEFAULT_CONFIG = {
     "brightness_tool": "auto",  # auto, xbacklight, or brightnessctl
     "volume_tool": "auto",  # auto, pulseaudio, or alsa
     "wallpaper_tool": "auto",  # auto, feh, or nitrogen
+    "wallpaper_scan_hidden": False,  # include hidden directories in --random scans
     "log_level": "INFO",
     "log_file": os.path.join(CONFIG_DIR, "i3ctl.log"),
 }
 
+# Last config text read or written, and the (mtime_ns, size) of the file it
+# matches. Callers get a fresh dict decoded from the text, which is cheaper than
+# copy.deepcopy and keeps one caller's changes from leaking into another's.
+_cached_config: Optional[str] = None
+_cached_stat: Optional[Tuple[int, int]] = None
+
+
+def _remember_config(config_text: str) -> None:
+    """
+    Remember the config text that is now on disk.
+
+    Args:
+        config_text: Serialized configuration matching CONFIG_FILE
+    """
+    global _cached_config, _cached_stat
+    
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        _cached_config = _cached_stat = None
+        return
+    
+    _cached_config = config_text
+    _cached_stat = (st.st_mtime_ns, st.st_size)
+
+
+def _cache_is_current() -> bool:
+    """
+    Check whether the remembered config text still matches the file on disk.
+
+    Returns:
+        True if CONFIG_FILE is unchanged since it was last read or written
+    """
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return False
+    
+    return _cached_stat == (st.st_mtime_ns, st.st_size)
+
 
 def ensure_config_dir() -> None:
     """
@@ -39,6 +81,10 @@ def load_config() -> Dict[str, Any]:
     Returns:
         Dict containing configuration
     """
+    # Reuse the last parse while the file is unchanged
+    if _cache_is_current():
+        return json.loads(_cached_config)
+    
     ensure_config_dir()
     
     if not os.path.exists(CONFIG_FILE):
@@ -48,7 +94,8 @@ def load_config() -> Dict[str, Any]:
     
     try:
         with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
+            config_text = f.read()
+        config = json.loads(config_text)
             
         # Update with any missing default keys
         updated = False
@@ -59,6 +106,8 @@ def load_config() -> Dict[str, Any]:
         
         if updated:
             save_config(config)
+        else:
+            _remember_config(config_text)
             
         return config
     except Exception as e:
@@ -77,11 +126,17 @@ def save_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    ensure_config_dir()
-    
     try:
+        config_text = json.dumps(config, indent=4)
+        
+        # Skip the write when the file already holds exactly this config
+        if config_text == _cached_config and _cache_is_current():
+            return True
+        
+        ensure_config_dir()
         with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=4)
+            f.write(config_text)
+        _remember_config(config_text)
         return True
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
@@ -6,6 +6,7 @@ import os
 import shutil
 import subprocess
 import asyncio
+import functools
 from typing import List, Optional, Tuple, Dict, Any, Union, Callable
 
 from i3ctl.utils.logger import logger
@@ -55,6 +56,7 @@ class SystemUtils:
         capture_output: bool = True,
         check: bool = False,
         timeout: Optional[float] = None,
+        env: Optional[Dict[str, str]] = None,
     ) -> Tuple[int, Optional[str], Optional[str]]:
         """
         Run a system command synchronously.
@@ -64,6 +66,7 @@ class SystemUtils:
             capture_output: Whether to capture stdout and stderr
             check: Whether to raise an exception on non-zero return code
             timeout: Timeout in seconds
+            env: Environment for the command (defaults to this process's)
 
         Returns:
             Tuple of (return_code, stdout, stderr)
@@ -78,6 +81,7 @@ class SystemUtils:
                     capture_output=True,
                     check=check,
                     timeout=timeout,
+                    env=env,
                 )
                 return result.returncode, result.stdout, result.stderr
             else:
@@ -86,6 +90,7 @@ class SystemUtils:
                     text=True,
                     check=check,
                     timeout=timeout,
+                    env=env,
                 )
                 return result.returncode, None, None
         except subprocess.CalledProcessError as e:
@@ -283,17 +288,25 @@ def check_command_exists(command: str) -> bool:
     """Backward compatibility function."""
     return SystemUtils.check_command_exists(command)
 
+
+@functools.lru_cache(maxsize=None)
+def has_command(command: str) -> bool:
+    """Check if a command exists, caching the result for this process."""
+    return check_command_exists(command)
+
+
 def run_command(
     command: List[str], 
     capture_output: bool = True,
     check: bool = False,
     timeout: Optional[float] = None,
     capture_stderr: bool = True,  # Added parameter for backwards compatibility
+    env: Optional[Dict[str, str]] = None,
 ) -> Tuple[int, Optional[str], Optional[str]]:
     """Backward compatibility function."""
     # The capture_stderr parameter is ignored since we always capture stderr
     # when capture_output is True in the new implementation
-    return SystemUtils.run_command(command, capture_output, check, timeout)
+    return SystemUtils.run_command(command, capture_output, check, timeout, env)
 
 def detect_tools() -> Dict[str, Dict[str, bool]]:
     """Backward compatibility function."""
@@ -30,7 +30,9 @@ setup(
         "python-xlib>=0.31",
         "pydbus>=0.6.0",
     ],
-    extras_require={},
+    extras_require={
+        "pulse": ["pulsectl>=20.2.4"],
+    },
     entry_points={
         "console_scripts": [
             "i3ctl=i3ctl.cli:main",
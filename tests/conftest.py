@@ -0,0 +1,22 @@
+"""
+Shared pytest fixtures.
+"""
+
+import pytest
+
+from i3ctl.utils import config
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(monkeypatch, tmp_path):
+    """Keep tests from reading or writing the user's config, cache and log files."""
+    config_dir = tmp_path / ".config" / "i3ctl"
+    
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(config, "CONFIG_DIR", str(config_dir))
+    monkeypatch.setattr(config, "CONFIG_FILE", str(config_dir / "config.json"))
+    monkeypatch.setattr(config, "CACHE_DIR", str(tmp_path / ".cache" / "i3ctl"))
+    monkeypatch.setitem(config.DEFAULT_CONFIG, "i3_config_path", str(tmp_path / ".config" / "i3" / "config"))
+    monkeypatch.setitem(config.DEFAULT_CONFIG, "log_file", str(config_dir / "i3ctl.log"))
+    monkeypatch.setattr(config, "_cached_config", None)
+    monkeypatch.setattr(config, "_cached_stat", None)
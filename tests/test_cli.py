@@ -0,0 +1,39 @@
+"""
+Tests for the i3ctl command line entry points.
+"""
+
+import sys
+
+from i3ctl.cli import execute_command, main
+from i3ctl.commands.power import PowerCommand
+from i3ctl.commands.workspace import WorkspaceCommand
+
+
+def test_execute_command_ignores_process_argv(monkeypatch):
+    """Subcommands are selected from the given arguments, not sys.argv."""
+    handled = []
+    monkeypatch.setattr(sys, "argv", ["i3ctl", "power", "lock"])
+    monkeypatch.setattr(PowerCommand, "handle", lambda self, args: handled.append(args.subcommand) or 0)
+
+    assert execute_command(["power", "status"]) == 0
+    assert handled == ["status"]
+
+
+def test_main_ignores_process_argv(monkeypatch):
+    """main() builds the subcommand named in its argv argument."""
+    handled = []
+    monkeypatch.setattr(sys, "argv", ["i3ctl", "power", "lock"])
+    monkeypatch.setattr(PowerCommand, "handle", lambda self, args: handled.append(args.subcommand) or 0)
+
+    assert main(["power", "cancel"]) == 0
+    assert handled == ["cancel"]
+
+
+def test_execute_command_builds_requested_workspace_subcommand(monkeypatch):
+    """Workspace subcommands are selected from the given arguments, not sys.argv."""
+    handled = []
+    monkeypatch.setattr(sys, "argv", ["i3ctl", "workspace", "goto", "1"])
+    monkeypatch.setattr(WorkspaceCommand, "handle", lambda self, args: handled.append(args.subcommand) or 0)
+
+    assert execute_command(["workspace", "layouts"]) == 0
+    assert handled == ["layouts"]
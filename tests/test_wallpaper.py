@@ -0,0 +1,47 @@
+"""
+Tests for the wallpaper command.
+"""
+
+import argparse
+
+import pytest
+
+from i3ctl.commands.wallpaper import WallpaperCommand
+
+
+def _parse(argv):
+    parser = argparse.ArgumentParser()
+    WallpaperCommand().setup_parser(parser.add_subparsers())
+    return parser.parse_args(argv)
+
+
+@pytest.mark.parametrize("cap", ["0", "-1", "many"])
+def test_sample_cap_rejects_non_positive_values(cap):
+    """--sample-cap must be an integer of at least 1."""
+    with pytest.raises(SystemExit):
+        _parse(["wallpaper", "--random", "--sample-cap", cap])
+
+
+def test_sample_cap_stops_scan_after_cap(monkeypatch, tmp_path):
+    """With a sample cap, only the first N images are scanned and picked from."""
+    images = [str(tmp_path / f"{i}.png") for i in range(10)]
+    scanned = []
+    chosen = []
+    
+    def iter_image_files(self, directory):
+        for path in images:
+            scanned.append(path)
+            yield path
+    
+    monkeypatch.setattr(WallpaperCommand, "_iter_image_files", iter_image_files)
+    monkeypatch.setattr(
+        WallpaperCommand,
+        "_set_wallpaper",
+        lambda self, handler, path, mode, validated=False: chosen.append(path),
+    )
+    
+    args = _parse(["wallpaper", "--random", "--sample-cap", "3"])
+    WallpaperCommand()._set_random_wallpaper(None, str(tmp_path), "fill", args.sample_cap)
+    
+    assert scanned == images[:3]
+    assert len(chosen) == 1 and chosen[0] in images[:3]